@@ -5,7 +5,9 @@ m4tth4ck
 Original leet.py by Tim Tomes (LaNMaSteR53)
 Enhanced wrapper by: Enhanced Development Team
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import atexit
 import re
 import sys
 import uuid
@@ -13,6 +15,17 @@ import os
 import json
 
 from recon.core import framework
+from recon.core.constants import BannerWrapper
+
+_VERSION_RE = re.compile(r"'(\d+\.\d+\.\d+[^']*)'")
+
+# application and home directory layout, resolved once at import
+_APP_PATH = Path(sys.path[0])
+_CORE_PATH = _APP_PATH / 'core'
+_RECON_HOME = Path.home() / '.recon-ng'
+_MOD_PATH = _RECON_HOME / 'modules'
+_DATA_PATH = _RECON_HOME / 'data'
+_SPACES_PATH = _RECON_HOME / 'workspaces'
 
 class Recon(framework.Framework):
 
@@ -29,14 +42,24 @@ class Recon(framework.Framework):
         self._analytics = analytics
         self._marketplace = marketplace
         self._accessible = accessible
+        self._cid = None
 
         # Pfade als Klassenvariablen
-        self.app_path = framework.Framework.app_path = Path(sys.path[0])
-        self.core_path = framework.Framework.core_path = self.app_path / 'core'
-        self.home_path = framework.Framework.home_path = Path.home() / '.recon-ng'
-        self.mod_path = framework.Framework.mod_path = self.home_path / 'modules'
-        self.data_path = framework.Framework.data_path = self.home_path / 'data'
-        self.spaces_path = framework.Framework.spaces_path = self.home_path / 'workspaces'
+        self._publish_paths()
+
+    def _publish_paths(self):
+        # paths are shared with every framework instance via class attributes
+        paths = dict(
+            app_path=_APP_PATH,
+            core_path=_CORE_PATH,
+            home_path=_RECON_HOME,
+            mod_path=_MOD_PATH,
+            data_path=_DATA_PATH,
+            spaces_path=_SPACES_PATH,
+        )
+        for name, path in paths.items():
+            setattr(self, name, path)
+            setattr(framework.Framework, name, path)
 
     def start(self, mode, workspace='default'):
         self._mode = framework.Framework._mode = mode
@@ -61,7 +84,9 @@ class Recon(framework.Framework):
     def _init_home(self):
         self.home_path.mkdir(parents=True, exist_ok=True)
         self._query_keys('CREATE TABLE IF NOT EXISTS keys (name TEXT PRIMARY KEY, value TEXT)')
-        self._fetch_module_index()
+        # marketplace=False skips the remote index fetch for offline, fast startup
+        if self._marketplace:
+            self._fetch_module_index()
 
     def _check_version(self):
         if not self._check:
@@ -71,7 +96,7 @@ class Recon(framework.Framework):
         try:
             version_url = 'https://raw.githubusercontent.com/lanmaster53/recon-ng/master/VERSION'
             content = self.request('GET', version_url).text
-            remote = re.search(r"'(\d+\.\d+\.\d+[^']*)'", content).group(1)
+            remote = _VERSION_RE.search(content).group(1)
         except Exception as e:
             self.error(f"Version check failed ({type(e).__name__}).")
             return
@@ -83,38 +108,55 @@ class Recon(framework.Framework):
             self.output(f"Local version:   {__version__}")
 
     def _print_banner(self):
-        banner = BANNER_SMALL if self._accessible else BANNER
+        banner_key = 'small' if self._accessible else 'default'
+        banner = BannerWrapper.get(banner_key, colorize=False)
         author_info = (
             f"{framework.Colors.O}{self._name}, version {__version__}, by {__author__}{framework.Colors.N}"
             if self._accessible
-            else f"{framework.Colors.O}[{self._name} v{__version__}, {__author__}]{framework.Colors.N}".center(len(max(banner.splitlines(), key=len)) + 8)
+            else f"{framework.Colors.O}[{self._name} v{__version__}, {__author__}]{framework.Colors.N}".center(BannerWrapper.width_of(banner_key) + 8)
         )
         print(banner)
         print(author_info)
         print('')
 
-        counts = [(len(self._loaded_category[x]), x) for x in self._loaded_category]
+        counts, max_len = self._banner_counts()
         if counts:
-            max_len = max(len(str(count[0])) for count in counts)
-            for count in sorted(counts, reverse=True):
-                cnt = f"[{count[0]}]".ljust(max_len + 2)
-                print(f"{framework.Colors.B}{cnt} {count[1].title()} modules{framework.Colors.N}")
+            B, N = framework.Colors.B, framework.Colors.N
+            sys.stdout.write('\n'.join(
+                f"{B}{f'[{cnt}]'.ljust(max_len + 2)} {category.title()} modules{N}"
+                for cnt, category in counts
+            ) + '\n')
+            for count in counts:
                 setattr(self, f"do_{count[0]}", self._menu_egg)
         else:
             self.alert('No modules enabled/installed.')
         print()
 
+    def _banner_counts(self):
+        # sorted module counts per category, reused until the loaded categories change
+        fp = tuple((k, len(v)) for k, v in self._loaded_category.items())
+        cache = getattr(self, '_banner_counts_cache', None)
+        if cache and cache[0] == fp:
+            return cache[1], cache[2]
+        counts = [(len(self._loaded_category[x]), x) for x in self._loaded_category]
+        counts.sort(reverse=True)
+        max_len = len(str(counts[0][0])) if counts else 0
+        self._banner_counts_cache = (fp, counts, max_len)
+        return counts, max_len
+
     def _send_analytics(self, cd):
         if not self._analytics:
             self.debug('Analytics disabled.')
             return
 
         try:
-            cid_file = self.home_path / '.cid'
-            if not cid_file.exists():
-                cid_file.write_text(str(uuid.uuid4()), encoding='utf-8')
+            if self._cid is None:
+                cid_file = self.home_path / '.cid'
+                if not cid_file.exists():
+                    cid_file.write_text(str(uuid.uuid4()), encoding='utf-8')
+                self._cid = cid_file.read_text(encoding='utf-8').strip()
 
-            cid = cid_file.read_text(encoding='utf-8').strip()
+            cid = self._cid
             params = {
                 'v': 1,
                 'tid': 'UA-52269615-2',
@@ -124,6 +166,19 @@ class Recon(framework.Framework):
                 'av': __version__,
                 'cd': cd,
             }
+            self._get_analytics_executor().submit(self._post_analytics, params)
+        except Exception as e:
+            self.debug(f"Analytics failed ({type(e).__name__}).")
+
+    def _get_analytics_executor(self):
+        # single background worker so analytics never block the interactive flow
+        if getattr(self, '_analytics_executor', None) is None:
+            self._analytics_executor = ThreadPoolExecutor(max_workers=1)
+            atexit.register(self._analytics_executor.shutdown, wait=False)
+        return self._analytics_executor
+
+    def _post_analytics(self, params):
+        try:
             self.request('GET', 'https://www.google-analytics.com/collect', params=params)
         except Exception as e:
             self.debug(f"Analytics failed ({type(e).__name__}).")
@@ -5,6 +5,8 @@ ANSI-Banner-Manager für Recon-ng
 m4tth4ck & Enhanced Dev Team
 """
 
+from functools import lru_cache
+from pathlib import Path
 import random
 
 class BannerColors:
@@ -42,65 +44,35 @@ class BannerWrapper:
         'web': ('BANNER_WEB', BannerColors.CYAN),
     }
 
-    BANNER_DEBUG = r'''
-  _____                         _   _             
- |  __ \                       | | (_)            
- | |__) | ___  ___ ___  _ __   | |_ _  ___  _ __  
- |  _  // _ \/ __/ _ \| '_ \  | __| |/ _ \| '_ \ 
- | | \ \  __/ (_| (_) | | | | | |_| | (_) | | | |
- |_|  \_\___|\___\___/|_| |_|  \__|_|\___/|_| |_| 
-  :: Powered by Recon-ng (Debug Mode) ::
-'''
+    # banner art lives in recon/core/banners/ and is read on first use only
+    _BANNER_DIR = Path(__file__).parent / 'banners'
+    _banner_cache = {}
 
-    BANNER = r'''
-    _/_/_/    _/_/_/_/    _/_/_/    _/_/_/    _/      _/            _/      _/    _/_/_/
-   _/    _/  _/        _/        _/      _/  _/_/    _/            _/_/    _/  _/       
-  _/_/_/    _/_/_/    _/        _/      _/  _/  _/  _/  _/_/_/_/  _/  _/  _/  _/  _/_/_/
- _/    _/  _/        _/        _/      _/  _/    _/_/            _/    _/_/  _/      _/ 
-_/    _/  _/_/_/_/    _/_/_/    _/_/_/    _/      _/            _/      _/    _/_/_/    
-
-                                          /\
-                                         / \\ /\
-    Sponsored by...               /\  /\/  \\V  \/\
-                                 / \\/ // \\\\\ \\ \/\
-                                // // BLACK HILLS \/ \\
-                               www.blackhillsinfosec.com
-
-                  ____   ____   ____   ____ _____ _  ____   ____  ____
-                 |____] | ___/ |____| |       |   | |____  |____ |
-                 |      |   \_ |    | |____   |   |  ____| |____ |____
-                                   www.practisec.com
-'''
-
-    BANNER_SMALL = r'''
-RECON-NG
-
-Sponsored by...
-- BLACK HILLS INFORMATION SECURITY at www.blackhillsinfosec.com
-- PRACTISEC at www.practisec.com
-'''
+    @classmethod
+    def _lazy(cls, banner_name):
+        banner = cls._banner_cache.get(banner_name)
+        if banner is None:
+            path = cls._BANNER_DIR / f"{banner_name.lower()}.txt"
+            banner = cls._banner_cache[banner_name] = path.read_text(encoding='utf-8')
+        return banner
 
-    BANNER_WEB = r'''
-                     __                                                     __      __                             
-                    |  \                                                   |  \    |  \                            
-  ______    ______   \$$ _______    _______   ______   _______    ______  _| $$_    \$$         _______    ______  
- /      \  /      \ |  \|       \  /       \ /      \ |       \  |      \|   $$ \  |  \ ______ |       \  /      \ 
-|  $$$$$$\|  $$$$$$\| $$| $$$$$$$\|  $$$$$$$|  $$$$$$\| $$$$$$$\  \$$$$$$\\$$$$$$  | $$|      \| $$$$$$$\|  $$$$$$\
-| $$   \$$| $$    $$| $$| $$  | $$| $$      | $$  | $$| $$  | $$ /      $$ | $$ __ | $$ \$$$$$$| $$  | $$| $$  | $$
-| $$      | $$$$$$$$| $$| $$  | $$| $$_____ | $$__/ $$| $$  | $$|  $$$$$$$ | $$|  \| $$        | $$  | $$| $$__| $$
-| $$       \$$     \| $$| $$  | $$ \$$     \ \$$    $$| $$  | $$ \$$    $$  \$$  $$| $$        | $$  | $$ \$$    $$
- \$$        \$$$$$$$ \$$ \$$   \$$  \$$$$$$$  \$$$$$$  \$$   \$$  \$$$$$$$   \$$$$  \$$         \$$   \$$ _\$$$$$$$
-                                                                                                         |  \__| $$
-                                                                                                          \$$    $$
-                                                                                                           \$$$$$$ 
-'''
+    @staticmethod
+    def get(mode='default', colorize=True):
+        return BannerWrapper._render(mode, bool(colorize))
 
-    @classmethod
-    def get(cls, mode='default', colorize=True):
-        banner_name, color = cls.BANNERS.get(mode, cls.BANNERS['default'])
-        banner_content = getattr(cls, banner_name)
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _render(mode, colorize):
+        banner_name, color = BannerWrapper.BANNERS.get(mode, BannerWrapper.BANNERS['default'])
+        banner_content = BannerWrapper._lazy(banner_name)
         return f"{color}{banner_content}{BannerColors.RESET}" if colorize else banner_content
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def width_of(mode='default'):
+        banner_name, _ = BannerWrapper.BANNERS.get(mode, BannerWrapper.BANNERS['default'])
+        return max(map(len, BannerWrapper._lazy(banner_name).splitlines()))
+
 
 # Optional helper for HTML
 def random_html_color():
@@ -1,9 +1,30 @@
-import mechanize
-import socket
+from __future__ import annotations
+
+from collections import ChainMap
+import functools
 import ssl
 import logging
-from urllib.parse import urlparse
-from typing import Dict, Optional, Any
+import re
+from typing import Dict, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import mechanize
+
+# Schneller Pfad für den Normalfall "schema://host[:port]"
+_PROXY_RE = re.compile(r'^(https?|socks[45]?)://[^/\s:@]+(?::\d+)?/?$', re.I)
+
+# mechanize wird erst beim ersten Browser-Aufbau importiert
+_mechanize = None
+
+
+def _load_mechanize():
+    """Importiert mechanize bei Bedarf und hält das Modul modulweit vor."""
+    global _mechanize
+    if _mechanize is None:
+        import mechanize
+        import mechanize._http
+        _mechanize = mechanize
+    return _mechanize
 
 
 class BrowserMixin:
@@ -19,6 +40,9 @@ class BrowserMixin:
     - Cookie-Handling
     """
 
+    # logging.basicConfig() wird höchstens einmal pro Prozess aufgerufen
+    _debug_logging_initialized = False
+
     def __init__(self):
         # Standardoptionen falls _global_options nicht definiert ist
         if not hasattr(self, '_global_options'):
@@ -27,6 +51,9 @@ class BrowserMixin:
         # Logger für Debug-Zwecke
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # SSL-Kontexte je verify_ssl-Wert; teuer im Aufbau, aber gefahrlos teilbar
+        self._ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+
     def _get_default_options(self) -> Dict[str, Any]:
         """Gibt Standard-Konfigurationsoptionen zurück."""
         return {
@@ -46,6 +73,9 @@ class BrowserMixin:
         """
         Erstellt und konfiguriert eine mechanize.Browser-Instanz.
 
+        Jeder Aufruf liefert einen eigenen Browser (mechanize ist nicht
+        thread-sicher); nur der SSL-Kontext wird zwischen Aufrufen geteilt.
+
         Returns:
             mechanize.Browser: Konfigurierte Browser-Instanz
 
@@ -53,26 +83,38 @@ class BrowserMixin:
             ValueError: Bei ungültigen Proxy-Einstellungen
             ConnectionError: Bei Netzwerkproblemen
         """
+        mechanize = _load_mechanize()
+
+        # Alle browserrelevanten Optionen in einem Durchgang lesen
+        o = self._global_options
+        user_agent, verbosity, proxy, verify_ssl, timeout = (
+            o.get('user-agent'), o.get('verbosity', 0), o.get('proxy'), o.get('verify_ssl', True),
+            o.get('timeout', 30))
+        follow_redirects, handle_cookies, handle_refresh, ignore_robots = (
+            o.get('follow_redirects', True), o.get('handle_cookies', True),
+            o.get('handle_refresh', True), o.get('ignore_robots', True))
+
         try:
             br = mechanize.Browser()
 
             # User-Agent konfigurieren
-            self._configure_user_agent(br)
+            self._configure_user_agent(br, user_agent)
 
             # Debug-Optionen setzen
-            self._configure_debug_options(br)
+            self._configure_debug_options(br, verbosity)
 
             # Proxy konfigurieren
-            self._configure_proxy(br)
+            self._configure_proxy(br, proxy)
 
             # Browser-Verhalten konfigurieren
-            self._configure_browser_behavior(br)
+            self._configure_browser_behavior(br, ignore_robots, follow_redirects,
+                                             handle_cookies, handle_refresh)
 
-            # Timeout global setzen
-            self._configure_timeout()
+            # Timeout pro Browser statt global per socket.setdefaulttimeout()
+            self._configure_timeout(br, timeout)
 
             # SSL-Konfiguration
-            self._configure_ssl()
+            self._configure_ssl(br, verify_ssl)
 
             self.logger.debug("Browser erfolgreich konfiguriert")
             return br
@@ -81,31 +123,29 @@ class BrowserMixin:
             self.logger.error(f"Fehler beim Erstellen des Browsers: {e}")
             raise
 
-    def _configure_user_agent(self, browser: mechanize.Browser) -> None:
+    def _configure_user_agent(self, browser: mechanize.Browser, user_agent: Optional[str]) -> None:
         """Konfiguriert den User-Agent Header."""
-        user_agent = self._global_options.get('user-agent')
         if user_agent:
             browser.addheaders = [('User-agent', user_agent)]
             self.logger.debug(f"User-Agent gesetzt: {user_agent}")
 
-    def _configure_debug_options(self, browser: mechanize.Browser) -> None:
+    def _configure_debug_options(self, browser: mechanize.Browser, verbosity: int) -> None:
         """Konfiguriert Debug-Optionen basierend auf Verbosity-Level."""
-        verbosity = self._global_options.get('verbosity', 0)
+        if verbosity < 2:
+            return
 
-        if verbosity >= 2:
-            browser.set_debug_http(True)
-            browser.set_debug_redirects(True)
-            browser.set_debug_responses(True)
-            self.logger.debug("Debug-Modus aktiviert")
+        browser.set_debug_http(True)
+        browser.set_debug_redirects(True)
+        browser.set_debug_responses(True)
+        self.logger.debug("Debug-Modus aktiviert")
 
-        if verbosity >= 3:
-            # Zusätzliche Debug-Optionen
+        if verbosity >= 3 and not BrowserMixin._debug_logging_initialized:
+            # Zusätzliche Debug-Optionen (nur einmal pro Prozess)
             logging.basicConfig(level=logging.DEBUG)
+            BrowserMixin._debug_logging_initialized = True
 
-    def _configure_proxy(self, browser: mechanize.Browser) -> None:
+    def _configure_proxy(self, browser: mechanize.Browser, proxy: Optional[str]) -> None:
         """Konfiguriert Proxy-Einstellungen."""
-        proxy = self._global_options.get('proxy')
-
         if proxy:
             # Validiere Proxy-Format
             if not self._validate_proxy(proxy):
@@ -118,45 +158,45 @@ class BrowserMixin:
             browser.set_proxies(proxy_dict)
             self.logger.debug(f"Proxy konfiguriert: {proxy}")
 
-    def _configure_browser_behavior(self, browser: mechanize.Browser) -> None:
+    def _configure_browser_behavior(self, browser: mechanize.Browser, ignore_robots: bool,
+                                    follow_redirects: bool, handle_cookies: bool,
+                                    handle_refresh: bool) -> None:
         """Konfiguriert allgemeines Browser-Verhalten."""
         # Robots.txt ignorieren
-        ignore_robots = self._global_options.get('ignore_robots', True)
         browser.set_handle_robots(not ignore_robots)
 
         # Redirects behandeln
-        follow_redirects = self._global_options.get('follow_redirects', True)
         browser.set_handle_redirect(follow_redirects)
 
         # Cookies behandeln
-        handle_cookies = self._global_options.get('handle_cookies', True)
         browser.set_handle_equiv(handle_cookies)
 
         # Refresh-Header behandeln
-        handle_refresh = self._global_options.get('handle_refresh', True)
-        browser.set_handle_refresh(mechanize._http.HTTPRefreshProcessor(),
+        browser.set_handle_refresh(_load_mechanize()._http.HTTPRefreshProcessor(),
                                    max_time=1, honor_time=handle_refresh)
 
-        # Maximale Anzahl von Redirects
-        max_redirects = self._global_options.get('max_redirects', 10)
-        if hasattr(browser, 'set_handle_redirect'):
-            # Implementierung abhängig von mechanize-Version
-            pass
+    def _configure_timeout(self, browser: mechanize.Browser, timeout: float) -> None:
+        """Setzt das Standard-Timeout für open()/open_novisit() dieses Browsers."""
+        # Ein explizites timeout=... des Aufrufers hat weiterhin Vorrang
+        browser.open = functools.partial(browser.open, timeout=timeout)
+        browser.open_novisit = functools.partial(browser.open_novisit, timeout=timeout)
+        self.logger.debug(f"Timeout gesetzt: {timeout}s")
+
+    def _configure_ssl(self, browser: mechanize.Browser, verify_ssl: bool) -> None:
+        """Konfiguriert SSL-Verifikation pro Browser (ohne globalen Monkey-Patch)."""
+        context = self._ssl_contexts.get(verify_ssl)
+        if context is None:
+            context = ssl.create_default_context()
 
-    def _configure_timeout(self) -> None:
-        """Konfiguriert Socket-Timeout global."""
-        timeout = self._global_options.get('timeout', 30)
-        socket.setdefaulttimeout(timeout)
-        self.logger.debug(f"Socket-Timeout gesetzt: {timeout}s")
+            if not verify_ssl:
+                # SSL-Verifikation deaktivieren (Vorsicht!)
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+                self.logger.warning("SSL-Verifikation deaktiviert!")
 
-    def _configure_ssl(self) -> None:
-        """Konfiguriert SSL-Verifikation."""
-        verify_ssl = self._global_options.get('verify_ssl', True)
+            self._ssl_contexts[verify_ssl] = context
 
-        if not verify_ssl:
-            # SSL-Verifikation deaktivieren (Vorsicht!)
-            ssl._create_default_https_context = ssl._create_unverified_context
-            self.logger.warning("SSL-Verifikation deaktiviert!")
+        browser.set_ca_data(context=context)
 
     def _validate_proxy(self, proxy: str) -> bool:
         """
@@ -168,6 +208,10 @@ class BrowserMixin:
         Returns:
             bool: True wenn gültig, False sonst
         """
+        if _PROXY_RE.match(proxy):
+            return True
+        # Fallback für seltenere Formen (z.B. mit Zugangsdaten)
+        from urllib.parse import urlparse
         try:
             parsed = urlparse(proxy)
             return all([parsed.scheme, parsed.netloc])
@@ -184,11 +228,11 @@ class BrowserMixin:
         Returns:
             mechanize.Browser: Konfigurierte Browser-Instanz
         """
-        # Temporär Optionen überschreiben
-        original_options = self._global_options.copy()
+        # Session-Optionen als Overlay über die globalen Optionen legen (ohne Kopie)
+        original_options = self._global_options
 
         if session_config:
-            self._global_options.update(session_config)
+            self._global_options = ChainMap(session_config, original_options)
 
         try:
             browser = self.get_browser()
@@ -1,19 +1,75 @@
 import asyncio
+import re
 import sqlite3
+import sys
+import threading
 import time
 import json
 import hashlib
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass, asdict
+import itertools
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, fields
+from contextlib import contextmanager
 from urllib.parse import parse_qs, urlparse
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
 
-@dataclass
+# default cache location, inside the recon-ng home directory
+_DEFAULT_DB_PATH = Path.home() / '.recon-ng' / 'github_cache.db'
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON as UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _params_blob(params: Dict) -> str:
+    """Serialize request params into their canonical cache form."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+
+def _endpoint_key(endpoint: str, params_blob: str) -> str:
+    """Build the api_cache key for an endpoint and its serialized params."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(endpoint.encode())
+    h.update(b"\x00")
+    h.update(params_blob.encode())
+    return h.hexdigest()
+
+
+# slotted dataclasses need Python 3.10+; older interpreters fall back to a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class GitHubHost:
     """Represents a GitHub host/repository."""
     id: Optional[int] = None
@@ -36,6 +92,21 @@ class GitHubHost:
         if not self.full_name and self.owner and self.repo:
             self.full_name = f"{self.owner}/{self.repo}"
 
+    @staticmethod
+    def _api_row(r: Dict, cached_at: str = "") -> tuple:
+        """Map a GitHub API repository dict onto the fields after ``id``, in order."""
+        return (
+            r['owner']['login'], r['name'], r['full_name'], r.get('description') or '',
+            r['html_url'], r['clone_url'], r['ssh_url'], r.get('language') or '',
+            r['stargazers_count'], r['forks_count'], r['created_at'], r['updated_at'],
+            r['pushed_at'], cached_at
+        )
+
+    @classmethod
+    def from_api_dict(cls, r: Dict) -> 'GitHubHost':
+        """Build a host from a GitHub API repository dict."""
+        return cls(None, *cls._api_row(r))
+
 
 @dataclass
 class GitHubAPIOptions:
@@ -46,18 +117,84 @@ class GitHubAPIOptions:
     retry_attempts: int = 3
     base_delay: float = 1.0
     cache_duration_hours: int = 24
+    parallel: bool = False
+    concurrency: int = 64
 
 
 class GitHubDatabase:
-    """SQLite database manager for GitHub data."""
-
-    def __init__(self, db_path: str = "github_cache.db"):
-        self.db_path = Path(db_path)
+    """SQLite database manager for GitHub data.
+
+    The database runs in WAL mode, so readers do not block behind writers.
+    SQLite keeps ``<db>-wal`` and ``<db>-shm`` side files next to the database
+    while it is open; copy all three together when moving a live cache.
+    """
+
+    # bumped whenever the api_cache layout changes
+    _CACHE_SCHEMA_VERSION = 3
+    # refresh planner statistics after this many written rows
+    _ANALYZE_EVERY = 1000
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path) if db_path else _DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._writes = 0
+        self._conn = self._connect()
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection shared by all database operations."""
+        # autocommit mode; transactions are managed explicitly by _transaction()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # INSERT OR REPLACE must fire the delete trigger that keeps the FTS index in sync
+        conn.execute("PRAGMA recursive_triggers=ON")
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in a single BEGIN/COMMIT block."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
+    def optimize(self) -> None:
+        """Refresh the query planner statistics."""
+        with self._lock:
+            self._writes = 0
+            self._conn.execute("PRAGMA optimize")
+            self._conn.execute("ANALYZE")
+
+    def _record_writes(self, count: int) -> None:
+        self._writes += count
+        if self._writes >= self._ANALYZE_EVERY:
+            self.optimize()
+
     def init_database(self) -> None:
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        # persistent setting, and it cannot be changed inside a transaction
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+
+        with self._transaction() as conn:
+            fresh = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'github_hosts'"
+            ).fetchone() is None
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS github_hosts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -78,14 +215,21 @@ class GitHubDatabase:
                 )
             """)
 
+            if conn.execute("PRAGMA user_version").fetchone()[0] < self._CACHE_SCHEMA_VERSION:
+                # api_cache only holds disposable responses, so older layouts are dropped
+                conn.execute("DROP TABLE IF EXISTS api_cache")
+                conn.execute(f"PRAGMA user_version={self._CACHE_SCHEMA_VERSION}")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS api_cache (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    endpoint_hash TEXT UNIQUE NOT NULL,
+                    endpoint_hash TEXT NOT NULL,
+                    page INTEGER NOT NULL,
                     endpoint TEXT NOT NULL,
                     params_json TEXT,
-                    response_json TEXT NOT NULL,
-                    cached_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    response_blob BLOB NOT NULL,
+                    is_last INTEGER NOT NULL DEFAULT 0,
+                    cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (endpoint_hash, page)
                 )
             """)
 
@@ -99,142 +243,333 @@ class GitHubDatabase:
                 ON github_hosts(language)
             """)
 
+            # cached_at holds ISO-8601 text, which sorts chronologically as-is
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_cache_hash 
-                ON api_cache(endpoint_hash)
+                CREATE INDEX IF NOT EXISTS idx_cache_cached_at
+                ON api_cache(cached_at)
             """)
 
-            conn.commit()
+            # partial index matching the top_languages GROUP BY in get_statistics
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hosts_lang_count
+                ON github_hosts(language) WHERE language IS NOT NULL AND language != ''
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hosts_stars
+                ON github_hosts(stars DESC, language)
+            """)
+
+            self._fts = self._init_fts(conn)
+
+        if fresh:
+            self.optimize()
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the trigram FTS5 index over full_name/description, if SQLite supports it.
+
+        The trigram tokenizer (SQLite 3.34+) keeps MATCH a plain substring search.
+        """
+        existed = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'github_hosts_fts'"
+        ).fetchone()
+        if existed and 'trigram' not in existed[0]:
+            # word-tokenized index from an older version only matches token prefixes
+            conn.execute("DROP TABLE github_hosts_fts")
+            existed = None
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS github_hosts_fts
+                USING fts5(full_name, description, content='github_hosts', content_rowid='id',
+                           tokenize='trigram')
+            """)
+        except sqlite3.OperationalError:
+            logger.debug("FTS5 trigram tokenizer not available, falling back to substring search")
+            for trigger in ('github_hosts_ai', 'github_hosts_ad', 'github_hosts_au'):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            return False
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS github_hosts_ai AFTER INSERT ON github_hosts BEGIN
+                INSERT INTO github_hosts_fts(rowid, full_name, description)
+                VALUES (new.id, new.full_name, new.description);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS github_hosts_ad AFTER DELETE ON github_hosts BEGIN
+                INSERT INTO github_hosts_fts(github_hosts_fts, rowid, full_name, description)
+                VALUES ('delete', old.id, old.full_name, old.description);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS github_hosts_au AFTER UPDATE ON github_hosts BEGIN
+                INSERT INTO github_hosts_fts(github_hosts_fts, rowid, full_name, description)
+                VALUES ('delete', old.id, old.full_name, old.description);
+                INSERT INTO github_hosts_fts(rowid, full_name, description)
+                VALUES (new.id, new.full_name, new.description);
+            END
+        """)
+
+        if not existed:
+            # index rows written before the FTS table existed
+            conn.execute("INSERT INTO github_hosts_fts(github_hosts_fts) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Turn free text into a trigram FTS5 substring query, or '' if it is too short."""
+        # trigrams cannot match fewer than three characters
+        if len(query) < 3:
+            return ''
+        return '"{}"'.format(query.replace('"', '""'))
+
+    # github_hosts columns in GitHubHost field order, for positional construction
+    _HOST_FIELDS = tuple(f.name for f in fields(GitHubHost))
+    _HOST_COLUMNS = ', '.join(_HOST_FIELDS)
+
+    _SAVE_HOST_SQL = """
+        INSERT OR REPLACE INTO github_hosts 
+        (owner, repo, full_name, description, url, clone_url, ssh_url, 
+         language, stars, forks, created_at, updated_at, pushed_at, cached_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _host_row(host: GitHubHost) -> tuple:
+        return (
+            host.owner, host.repo, host.full_name, host.description,
+            host.url, host.clone_url, host.ssh_url, host.language,
+            host.stars, host.forks, host.created_at, host.updated_at,
+            host.pushed_at, host.cached_at
+        )
 
     def save_host(self, host: GitHubHost) -> int:
         """Save or update a GitHub host in the database."""
         host.cached_at = datetime.now().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO github_hosts 
-                (owner, repo, full_name, description, url, clone_url, ssh_url, 
-                 language, stars, forks, created_at, updated_at, pushed_at, cached_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                host.owner, host.repo, host.full_name, host.description,
-                host.url, host.clone_url, host.ssh_url, host.language,
-                host.stars, host.forks, host.created_at, host.updated_at,
-                host.pushed_at, host.cached_at
-            ))
-            return conn.lastrowid
+        with self._transaction() as conn:
+            cursor = conn.execute(self._SAVE_HOST_SQL, self._host_row(host))
+        self._record_writes(1)
+        return cursor.lastrowid
+
+    def save_hosts(self, hosts: List[GitHubHost]) -> None:
+        """Save or update many GitHub hosts in a single transaction."""
+        cached_at = datetime.now().isoformat()
+        for host in hosts:
+            host.cached_at = cached_at
+
+        self.save_host_rows([self._host_row(host) for host in hosts])
+
+    def save_host_rows(self, rows: List[tuple]) -> None:
+        """Save or update many hosts given as rows in _SAVE_HOST_SQL column order."""
+        with self._transaction() as conn:
+            conn.executemany(self._SAVE_HOST_SQL, rows)
+        self._record_writes(len(rows))
 
     def get_host(self, full_name: str) -> Optional[GitHubHost]:
         """Retrieve a host by full name."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM github_hosts WHERE full_name = ?",
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {self._HOST_COLUMNS} FROM github_hosts WHERE full_name = ?",
                 (full_name,)
             )
             row = cursor.fetchone()
             if row:
-                return GitHubHost(**dict(row))
+                return GitHubHost(*row)
         return None
 
     def search_hosts(self, query: str, language: str = None) -> List[GitHubHost]:
         """Search hosts by query and optionally filter by language."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            sql = """
-                SELECT * FROM github_hosts 
-                WHERE (full_name LIKE ? OR description LIKE ?)
-            """
-            params = [f"%{query}%", f"%{query}%"]
+        fts_query = self._fts_query(query) if self._fts else ''
+        with self._lock:
+            if fts_query:
+                sql = """
+                    SELECT {columns} FROM github_hosts_fts f
+                    JOIN github_hosts h ON h.id = f.rowid
+                    WHERE github_hosts_fts MATCH :q
+                """
+                params = {'q': fts_query}
+                column_prefix = "h."
+            else:
+                # case-insensitive substring match, like the LIKE '%q%' it replaces
+                sql = """
+                    SELECT {columns} FROM github_hosts 
+                    WHERE (instr(lower(full_name), :q) > 0 OR instr(lower(description), :q) > 0)
+                """
+                params = {'q': query.lower()}
+                column_prefix = ""
 
             if language:
-                sql += " AND language = ?"
-                params.append(language)
-
-            sql += " ORDER BY stars DESC LIMIT 100"
-
-            cursor = conn.execute(sql, params)
-            return [GitHubHost(**dict(row)) for row in cursor.fetchall()]
-
-    def cache_api_response(self, endpoint: str, params: Dict, response: Any) -> None:
-        """Cache an API response."""
-        endpoint_hash = hashlib.md5(
-            f"{endpoint}{json.dumps(params, sort_keys=True)}".encode()
-        ).hexdigest()
-
-        with sqlite3.connect(self.db_path) as conn:
+                sql += f" AND {column_prefix}language = :language"
+                params['language'] = language
+
+            sql += f" ORDER BY {column_prefix}stars DESC LIMIT 100"
+            columns = ', '.join(column_prefix + column for column in self._HOST_FIELDS)
+
+            cursor = self._conn.execute(sql.format(columns=columns), params)
+            hosts = []
+            rows = cursor.fetchmany(250)
+            while rows:
+                hosts.extend(GitHubHost(*row) for row in rows)
+                rows = cursor.fetchmany(250)
+            return hosts
+
+    def cache_api_page(self, endpoint: str, params: Dict, page: int, response: Any,
+                       is_last: bool, params_blob: Optional[str] = None) -> None:
+        """Cache a single page of an API response."""
+        if params_blob is None:
+            params_blob = _params_blob(params)
+        endpoint_hash = _endpoint_key(endpoint, params_blob)
+
+        with self._transaction() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO api_cache 
-                (endpoint_hash, endpoint, params_json, response_json, cached_at)
-                VALUES (?, ?, ?, ?, ?)
+                (endpoint_hash, page, endpoint, params_json, response_blob, is_last, cached_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
-                endpoint_hash, endpoint, json.dumps(params),
-                json.dumps(response), datetime.now().isoformat()
+                endpoint_hash, page, endpoint, params_blob,
+                _json_dumps(response),
+                int(is_last), datetime.now().isoformat()
             ))
+        self._record_writes(1)
 
-    def get_cached_response(self, endpoint: str, params: Dict,
-                            max_age_hours: int = 24) -> Optional[Any]:
-        """Get cached API response if not expired."""
-        endpoint_hash = hashlib.md5(
-            f"{endpoint}{json.dumps(params, sort_keys=True)}".encode()
-        ).hexdigest()
+    def get_cached_page(self, endpoint: str, params: Dict, page: int,
+                        max_age_hours: int = 24,
+                        params_blob: Optional[str] = None) -> Optional[Tuple[Any, bool]]:
+        """Get a cached response page and whether it was the last one, if not expired."""
+        if params_blob is None:
+            params_blob = _params_blob(params)
+        endpoint_hash = _endpoint_key(endpoint, params_blob)
 
         cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT response_json FROM api_cache 
-                WHERE endpoint_hash = ? AND datetime(cached_at) > ?
-            """, (endpoint_hash, cutoff_time.isoformat()))
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT response_blob, is_last FROM api_cache 
+                WHERE endpoint_hash = ? AND page = ? AND cached_at > ?
+            """, (endpoint_hash, page, cutoff_time.isoformat()))
 
             row = cursor.fetchone()
             if row:
-                return json.loads(row[0])
+                return _json_loads(row[0]), bool(row[1])
         return None
 
     def cleanup_old_cache(self, max_age_days: int = 7) -> int:
         """Remove old cache entries."""
         cutoff_time = datetime.now() - timedelta(days=max_age_days)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.execute("""
                 DELETE FROM api_cache 
-                WHERE datetime(cached_at) < ?
+                WHERE cached_at < ?
             """, (cutoff_time.isoformat(),))
-            return cursor.rowcount
+        self.optimize()
+        return cursor.rowcount
 
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about cached hosts."""
+        with self._lock:
+            conn = self._conn
+            stats = {}
 
-class GitHubRateLimiter:
-    """Smart rate limiter that respects GitHub's rate limits."""
+            # Total hosts
+            cursor = conn.execute("SELECT COUNT(*) FROM github_hosts")
+            stats['total_hosts'] = cursor.fetchone()[0]
+
+            # Hosts by language
+            cursor = conn.execute("""
+                SELECT language, COUNT(*) as count 
+                FROM github_hosts 
+                WHERE language IS NOT NULL AND language != ''
+                GROUP BY language 
+                ORDER BY count DESC 
+                LIMIT 10
+            """)
+            stats['top_languages'] = dict(itertools.islice(cursor, 10))
+
+            # Most starred repos
+            cursor = conn.execute("""
+                SELECT full_name, stars 
+                FROM github_hosts 
+                ORDER BY stars DESC 
+                LIMIT 10
+            """)
+            stats['most_starred'] = dict(itertools.islice(cursor, 10))
 
-    def __init__(self):
-        self.last_request_time = 0
-        self.remaining_requests = 5000
+            return stats
+
+
+class GitHubRateLimiter:
+    """Token-bucket rate limiter calibrated from GitHub's rate limit headers."""
+
+    def __init__(self, capacity: int = 5000, window: float = 3600.0):
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.refill_rate = capacity / window
+        self.last_refill = time.monotonic()
+        self.remaining_requests = capacity
         self.reset_time = 0
-        self.min_delay = 0.1
+        self.blocked_until = 0.0
+        self._async_lock = None
+        self._async_lock_loop = None
 
     def update_from_headers(self, headers: Dict[str, str]) -> None:
         """Update rate limit info from response headers."""
-        if 'x-ratelimit-remaining' in headers:
-            self.remaining_requests = int(headers['x-ratelimit-remaining'])
+        now = time.monotonic()
+        wall_now = time.time()
+
         if 'x-ratelimit-reset' in headers:
             self.reset_time = int(headers['x-ratelimit-reset'])
+        if 'x-ratelimit-remaining' in headers:
+            self.remaining_requests = int(headers['x-ratelimit-remaining'])
+            # GitHub's count is authoritative; spread what is left over the rest of the window
+            self.tokens = float(min(self.capacity, self.remaining_requests))
+            self.last_refill = now
+            window_left = max(1.0, self.reset_time - wall_now)
+            self.refill_rate = max(1, self.remaining_requests) / window_left
+            if self.remaining_requests == 0:
+                self.blocked_until = max(self.blocked_until, now + window_left)
+        if 'retry-after' in headers:
+            try:
+                self.blocked_until = max(self.blocked_until, now + float(headers['retry-after']))
+            except ValueError:
+                pass
+
+    def _acquire(self) -> float:
+        """Take a token if one is available, otherwise return how long to wait."""
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.refill_rate
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limits."""
-        current_time = time.time()
-
-        if self.remaining_requests < 100:
-            delay = max(2.0, (self.reset_time - current_time) / max(1, self.remaining_requests))
-        else:
-            delay = self.min_delay
-
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < delay:
-            time.sleep(delay - time_since_last)
-
-        self.last_request_time = time.time()
+        delay = self._acquire()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._acquire()
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        # asyncio.Lock is tied to the loop it was first used on
+        loop = asyncio.get_running_loop()
+        if self._async_lock is None or self._async_lock_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_lock_loop = loop
+        return self._async_lock
+
+    async def await_if_needed(self) -> None:
+        """Async variant of wait_if_needed that yields to the event loop while waiting."""
+        async with self._get_async_lock():
+            delay = self._acquire()
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._acquire()
 
 
 class GitHubAPIError(Exception):
@@ -249,71 +584,121 @@ class GitHubAPIError(Exception):
 class GitHubMixin:
     """Modern GitHub API mixin with SQLite caching and improved features."""
 
-    def __init__(self, db_path: str = "github_cache.db"):
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None and getattr(self, 'home_path', None):
+            # framework modules keep their data in the workspace-independent home
+            db_path = Path(self.home_path) / 'github_cache.db'
         self.rate_limiter = GitHubRateLimiter()
         self.database = GitHubDatabase(db_path)
         self.base_url = 'https://api.github.com'
+        self._headers = None
 
     def get_github_headers(self) -> Dict[str, str]:
         """Get headers for GitHub API requests."""
-        token = self.get_key('github_api')
-        return {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'GitHubMixin/2.0'
-        }
+        if self._headers is None:
+            token = self.get_key('github_api')
+            self._headers = {
+                'Authorization': f'token {token}',
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'GitHubMixin/2.0'
+            }
+        return self._headers
+
+    def refresh_credentials(self) -> None:
+        """Drop the cached headers so the API key is read again on the next request."""
+        self._headers = None
 
     def _parse_link_header(self, link_header: str) -> Dict[str, str]:
         """Parse GitHub's Link header for pagination."""
-        links = {}
-        for link in link_header.split(','):
-            parts = link.strip().split(';')
-            if len(parts) == 2:
-                url = parts[0].strip('<>')
-                rel = parts[1].strip().split('=')[1].strip('"')
-                links[rel] = url
-        return links
+        return {rel: url for url, rel in _LINK_RE.findall(link_header)}
 
     def _handle_response(self, response) -> Union[Dict, List]:
         """Handle and validate API response."""
         self.rate_limiter.update_from_headers(response.headers)
+        return self._check_response_data(response.status_code,
+                                         _json_loads(response.content) if response.content else {})
 
-        if response.status_code == 404:
+    def _check_response_data(self, status_code: int, data: Any) -> Union[Dict, List]:
+        """Validate a decoded API response body against its status code."""
+        if status_code == 404:
             return []
-        elif response.status_code == 403:
+        elif status_code == 403:
             raise GitHubAPIError(
                 "Rate limit exceeded or access forbidden",
-                response.status_code,
-                response.json() if response.text else {}
+                status_code,
+                data
             )
-        elif response.status_code != 200:
-            error_data = response.json() if response.text else {}
+        elif status_code != 200:
             raise GitHubAPIError(
-                f"GitHub API error: {error_data.get('message', 'Unknown error')}",
-                response.status_code,
-                error_data
+                f"GitHub API error: {data.get('message', 'Unknown error')}",
+                status_code,
+                data
             )
 
-        return response.json()
+        return data
+
+    @staticmethod
+    def _extend_results(results: List, data: Union[Dict, List]) -> None:
+        # Handle both list and dict responses
+        if isinstance(data, dict):
+            results.append(data)
+        else:
+            results.extend(data)
 
     def query_github_api(self, endpoint: str, payload: Dict = None,
                          options: GitHubAPIOptions = None) -> List[Union[Dict, List]]:
         """Query GitHub API with caching and improved error handling."""
+        options = options or GitHubAPIOptions()
+
+        if options.parallel and aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.aquery_github_api(endpoint, payload, options))
+            # asyncio.run() cannot nest; callers inside a loop should await aquery_github_api
+            logger.debug("Event loop already running, querying sequentially")
+
+        results = []
+        for data in self.iter_query_github_api(endpoint, payload, options):
+            self._extend_results(results, data)
+        return results
+
+    def _iter_cached_pages(self, endpoint: str, payload: Dict, options: GitHubAPIOptions,
+                           params_blob: str) -> Iterator[Tuple[int, Any, bool]]:
+        """Yield consecutive cached pages, starting at page 1, until the first miss."""
+        page = 1
+        while options.max_pages is None or page <= options.max_pages:
+            cached = self.database.get_cached_page(
+                endpoint, payload, page, options.cache_duration_hours, params_blob=params_blob
+            )
+            if cached is None:
+                return
+            data, is_last = cached
+            yield page, data, is_last
+            if is_last:
+                return
+            page += 1
+
+    def iter_query_github_api(self, endpoint: str, payload: Dict = None,
+                              options: GitHubAPIOptions = None) -> Iterator[Union[Dict, List]]:
+        """Yield GitHub API results page by page, caching each page as it arrives."""
         payload = payload or {}
         options = options or GitHubAPIOptions()
+        params_blob = _params_blob(payload)
 
-        # Check cache first
-        cached_response = self.database.get_cached_response(
-            endpoint, payload, options.cache_duration_hours
-        )
-        if cached_response:
-            logger.info(f"Using cached response for {endpoint}")
-            return cached_response
+        # Serve what the cache has, then resume from the network at the first miss
+        page = 1
+        for page, data, is_last in self._iter_cached_pages(endpoint, payload, options, params_blob):
+            logger.debug(f"Using cached page {page} for {endpoint}")
+            if data:
+                yield data
+            if is_last or (options.max_pages is not None and page >= options.max_pages):
+                return
+            page += 1
 
         headers = self.get_github_headers()
         url = f"{self.base_url}{endpoint}"
-        results = []
-        page = 1
+        attempt = 0
 
         while True:
             self.rate_limiter.wait_if_needed()
@@ -325,39 +710,158 @@ class GitHubMixin:
                                         params=current_payload, timeout=options.timeout)
                 data = self._handle_response(response)
 
+                links = self._parse_link_header(response.headers.get('link', '')) if data else {}
+                is_last = 'next' not in links
+                self.database.cache_api_page(endpoint, payload, page, data, is_last,
+                                             params_blob=params_blob)
+
                 if not data:
                     break
 
-                # Handle both list and dict responses
-                if isinstance(data, dict):
-                    results.append(data)
-                else:
-                    results.extend(data)
+                attempt = 0
+                yield data
 
                 # Check for pagination
-                if ('link' in response.headers and
-                        'rel="next"' in response.headers['link'] and
-                        (options.max_pages is None or page < options.max_pages)):
+                if not is_last and (options.max_pages is None or page < options.max_pages):
                     page += 1
                 else:
                     break
 
             except GitHubAPIError as e:
                 logger.error(f"GitHub API error on {endpoint}: {e}")
-                if e.status_code == 403:  # Rate limit
-                    time.sleep(60)  # Wait a minute and try once more
-                    continue
-                break
+                if not self._is_retryable(e.status_code):
+                    break
+                if attempt >= options.retry_attempts:
+                    raise
+                # Retry-After / exhausted quota is honored by the rate limiter itself;
+                # otherwise back off exponentially with jitter
+                if self.rate_limiter.blocked_until <= time.monotonic():
+                    time.sleep(min(options.base_delay * 2 ** attempt + random.uniform(0, 1), 60))
+                attempt += 1
             except Exception as e:
                 logger.error(f"Unexpected error querying {endpoint}: {e}")
                 break
 
-        # Cache the results
-        if results:
-            self.database.cache_api_response(endpoint, payload, results)
+    @staticmethod
+    def _is_retryable(status_code: int) -> bool:
+        """Rate limiting and server errors are worth retrying."""
+        return status_code in (403, 429) or status_code >= 500
+
+    async def aquery_github_api(self, endpoint: str, payload: Dict = None,
+                                options: GitHubAPIOptions = None) -> List[Union[Dict, List]]:
+        """Query GitHub API, fetching all pages after the first concurrently.
+
+        Requires aiohttp; without it the synchronous query runs in a worker thread.
+        Unlike query_github_api, requests bypass the framework's request() helper.
+        """
+        payload = payload or {}
+        options = options or GitHubAPIOptions()
+
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            sequential = GitHubAPIOptions(**{**asdict(options), 'parallel': False})
+            return await loop.run_in_executor(None, self.query_github_api, endpoint, payload, sequential)
+
+        params_blob = _params_blob(payload)
+        results = []
+
+        # Serve what the cache has, then resume from the network at the first miss
+        first_page = 1
+        for first_page, data, is_last in self._iter_cached_pages(endpoint, payload, options, params_blob):
+            self._extend_results(results, data)
+            if is_last or (options.max_pages is not None and first_page >= options.max_pages):
+                return results
+            first_page += 1
+
+        url = f"{self.base_url}{endpoint}"
+        semaphore = asyncio.Semaphore(options.concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=options.concurrency)
+        timeout = aiohttp.ClientTimeout(total=options.timeout)
+
+        async with aiohttp.ClientSession(headers=self.get_github_headers(), connector=connector,
+                                         timeout=timeout) as session:
+
+            async def fetch_once(page: int):
+                async with semaphore:
+                    await self.rate_limiter.await_if_needed()
+                    params = {**payload, 'page': page, 'per_page': options.per_page}
+                    async with session.get(url, params=params) as response:
+                        self.rate_limiter.update_from_headers(response.headers)
+                        body = await response.read()
+                        data = self._check_response_data(response.status, _json_loads(body) if body else {})
+                        return data, self._parse_link_header(response.headers.get('link', ''))
+
+            async def fetch(page: int):
+                # same retry policy as iter_query_github_api
+                attempt = 0
+                while True:
+                    try:
+                        return await fetch_once(page)
+                    except GitHubAPIError as e:
+                        if not self._is_retryable(e.status_code) or attempt >= options.retry_attempts:
+                            raise
+                        logger.warning(f"GitHub API error on {endpoint} page {page}, retrying: {e}")
+                        if self.rate_limiter.blocked_until <= time.monotonic():
+                            await asyncio.sleep(min(options.base_delay * 2 ** attempt + random.uniform(0, 1), 60))
+                        attempt += 1
+
+            def give_up(e: Exception) -> None:
+                # exhausted retries propagate like in the sync path; anything else ends the query
+                if isinstance(e, GitHubAPIError) and self._is_retryable(e.status_code):
+                    raise e
+                logger.error(f"Error querying {endpoint}: {e}")
+
+            def store(page: int, data: Any, links: Dict[str, str]) -> None:
+                self.database.cache_api_page(endpoint, payload, page, data, 'next' not in links,
+                                             params_blob=params_blob)
+                self._extend_results(results, data)
+
+            try:
+                data, links = await fetch(first_page)
+            except Exception as e:
+                give_up(e)
+                return results
+            store(first_page, data, links)
+            if not data:
+                return results
+
+            last_page = self._page_number(links['last']) if 'last' in links else None
+            if last_page is None and 'next' in links:
+                # no total page count advertised, so follow the pages one by one
+                page = first_page + 1
+                while 'next' in links and (options.max_pages is None or page <= options.max_pages):
+                    try:
+                        data, links = await fetch(page)
+                    except Exception as e:
+                        give_up(e)
+                        return results
+                    store(page, data, links)
+                    if not data:
+                        break
+                    page += 1
+            elif last_page:
+                if options.max_pages is not None:
+                    last_page = min(last_page, options.max_pages)
+                page_numbers = range(first_page + 1, last_page + 1)
+                pages = await asyncio.gather(*(fetch(p) for p in page_numbers),
+                                             return_exceptions=True)
+                for page, fetched in zip(page_numbers, pages):
+                    if isinstance(fetched, Exception):
+                        # pages fetched so far stay cached; the rest is retried next time
+                        give_up(fetched)
+                        return results
+                    store(page, *fetched)
 
         return results
 
+    @staticmethod
+    def _page_number(url: str) -> Optional[int]:
+        """Extract the page query parameter from a pagination URL."""
+        try:
+            return int(parse_qs(urlparse(url).query)['page'][0])
+        except (KeyError, IndexError, ValueError):
+            return None
+
     def search_github_repositories(self, query: str, language: str = None,
                                    options: GitHubAPIOptions = None) -> List[GitHubHost]:
         """Search GitHub repositories and save them to database."""
@@ -373,34 +877,22 @@ class GitHubMixin:
             options=options
         )
 
-        hosts = []
+        # Build insert rows straight from the API dicts; hosts are created from the rows
+        cached_at = datetime.now().isoformat()
+        rows = []
         for result in results:
             if 'items' in result:  # Search results are wrapped
                 items = result['items']
             else:
                 items = [result] if isinstance(result, dict) else result
 
-            for repo in items:
-                host = GitHubHost(
-                    owner=repo['owner']['login'],
-                    repo=repo['name'],
-                    full_name=repo['full_name'],
-                    description=repo.get('description', ''),
-                    url=repo['html_url'],
-                    clone_url=repo['clone_url'],
-                    ssh_url=repo['ssh_url'],
-                    language=repo.get('language', ''),
-                    stars=repo['stargazers_count'],
-                    forks=repo['forks_count'],
-                    created_at=repo['created_at'],
-                    updated_at=repo['updated_at'],
-                    pushed_at=repo['pushed_at']
-                )
+            rows.extend([GitHubHost._api_row(r, cached_at) for r in items])
 
-                # Save to database
-                self.database.save_host(host)
-                hosts.append(host)
+        # Save to database in one transaction
+        if rows:
+            self.database.save_host_rows(rows)
 
+        hosts = [GitHubHost(None, *row) for row in rows]
         return hosts
 
     def get_repository_info(self, owner: str, repo: str,
@@ -423,21 +915,7 @@ class GitHubMixin:
             if results:
                 repo_data = results[0] if isinstance(results, list) else results
 
-                host = GitHubHost(
-                    owner=repo_data['owner']['login'],
-                    repo=repo_data['name'],
-                    full_name=repo_data['full_name'],
-                    description=repo_data.get('description', ''),
-                    url=repo_data['html_url'],
-                    clone_url=repo_data['clone_url'],
-                    ssh_url=repo_data['ssh_url'],
-                    language=repo_data.get('language', ''),
-                    stars=repo_data['stargazers_count'],
-                    forks=repo_data['forks_count'],
-                    created_at=repo_data['created_at'],
-                    updated_at=repo_data['updated_at'],
-                    pushed_at=repo_data['pushed_at']
-                )
+                host = GitHubHost.from_api_dict(repo_data)
 
                 self.database.save_host(host)
                 return host
@@ -456,34 +934,7 @@ class GitHubMixin:
 
     def get_host_statistics(self) -> Dict[str, Any]:
         """Get statistics about cached hosts."""
-        with sqlite3.connect(self.database.db_path) as conn:
-            stats = {}
-
-            # Total hosts
-            cursor = conn.execute("SELECT COUNT(*) FROM github_hosts")
-            stats['total_hosts'] = cursor.fetchone()[0]
-
-            # Hosts by language
-            cursor = conn.execute("""
-                SELECT language, COUNT(*) as count 
-                FROM github_hosts 
-                WHERE language IS NOT NULL AND language != ''
-                GROUP BY language 
-                ORDER BY count DESC 
-                LIMIT 10
-            """)
-            stats['top_languages'] = dict(cursor.fetchall())
-
-            # Most starred repos
-            cursor = conn.execute("""
-                SELECT full_name, stars 
-                FROM github_hosts 
-                ORDER BY stars DESC 
-                LIMIT 10
-            """)
-            stats['most_starred'] = dict(cursor.fetchall())
-
-            return stats
+        return self.database.get_statistics()
 
 
 # Example usage and testing
@@ -14,24 +14,32 @@ import csv
 import json
 import sqlite3
 import argparse
+import functools
 import logging
+import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Optional, Set
-from sqlalchemy import create_engine, Column, String, Integer, DateTime
+from typing import List, Dict, Optional, FrozenSet, Collection, Iterable, Iterator
+from sqlalchemy import create_engine, event, Column, String, Integer, DateTime
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
 import itertools
 import string
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('cruch.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 logger = logging.getLogger(__name__)
 
 # Leetspeak dictionary
@@ -49,6 +57,107 @@ LEET_DICT = {
     'v': ['\/'],
 }
 
+# Substitution table indexed by ord(char), covering upper and lower case
+LEET_TABLE: List[Optional[List[str]]] = [None] * 256
+for _key, _reps in LEET_DICT.items():
+    LEET_TABLE[ord(_key)] = _reps
+    LEET_TABLE[ord(_key.upper())] = _reps
+del _key, _reps
+
+# Same table as byte values, for substitutions that are all single ASCII chars
+LEET_BYTES: List[Optional[tuple]] = [
+    tuple(ord(r) for r in reps) if reps and all(len(r) == 1 and r.isascii() for r in reps) else None
+    for reps in LEET_TABLE
+]
+
+# 1 for every byte value that has a leet substitution, 0 otherwise
+LEET_MASK = bytes(1 if reps else 0 for reps in LEET_TABLE)
+
+if np is not None:
+    _LEET_MASK_ARRAY = np.frombuffer(LEET_MASK, dtype=np.bool_)
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True, nogil=True)
+    def _leet_positions_jit(word_bytes, mask):
+        positions = np.empty(word_bytes.shape[0], dtype=np.int32)
+        count = 0
+        for i in range(word_bytes.shape[0]):
+            if mask[word_bytes[i]]:
+                positions[count] = i
+                count += 1
+        return positions[:count]
+else:
+    _leet_positions_jit = None
+
+
+def _leet_positions(word: str) -> List[int]:
+    """Return the indices of all characters in word that have a leet substitution"""
+    if _leet_positions_jit is not None and word.isascii():
+        word_bytes = np.frombuffer(word.encode('ascii'), dtype=np.uint8)
+        return _leet_positions_jit(word_bytes, _LEET_MASK_ARRAY).tolist()
+    return [i for i, char in enumerate(word) if ord(char) < 256 and LEET_MASK[ord(char)]]
+
+
+def _words_with_substitutions(words: List[str]) -> List[str]:
+    """Return only the words that contain at least one substitutable character"""
+    if np is not None and words:
+        joined = ''.join(words)
+        length = len(words[0])
+        # Equal-length ASCII words (e.g. crunch output) form an (N, L) byte matrix
+        if length and all(len(word) == length for word in words) and joined.isascii():
+            matrix = np.frombuffer(joined.encode('ascii'), dtype=np.uint8).reshape(len(words), length)
+            hits = _LEET_MASK_ARRAY[matrix].any(axis=1)
+            return [word for word, hit in zip(words, hits.tolist()) if hit]
+    return [word for word in words if _leet_positions(word)]
+
+
+@functools.lru_cache(maxsize=200_000)
+def _generate_word_variants(word: str, limit: int = 1000) -> FrozenSet[str]:
+    """Generate up to `limit` leet variants for a single word (memoized)
+
+    Variants with fewer substitutions come first, so every single
+    substitution is kept before any multi-substitution product.
+    """
+    positions = _leet_positions(word)
+    if not positions or limit <= 0:
+        return frozenset()
+
+    if word.isascii() and all(LEET_BYTES[ord(word[i])] for i in positions):
+        # Single-byte substitutions: patch a byte buffer and decode once per variant
+        base = bytearray(word, 'ascii')
+        replacements = {i: LEET_BYTES[base[i]] for i in positions}
+        finish = bytearray.decode
+    else:
+        # Multi-char substitutions such as '\/' need string joins
+        base = list(word)
+        replacements = {i: LEET_TABLE[ord(word[i])] for i in positions}
+        finish = ''.join
+
+    variants = set()
+    for count in range(1, len(positions) + 1):
+        for chosen in itertools.combinations(positions, count):
+            for combo in itertools.product(*(replacements[i] for i in chosen)):
+                buf = base.copy()
+                for i, replacement in zip(chosen, combo):
+                    buf[i] = replacement
+                variants.add(finish(buf))
+                if len(variants) >= limit:
+                    return frozenset(variants)
+    variants.discard(word)
+    return frozenset(variants)
+
+
+# Output buffering for large wordlists
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_ITEMS = 10000
+JSON_STREAM_THRESHOLD = 100000
+
+# Number of generate_leet_variants results kept per SubroutineHandler
+WORDLIST_CACHE_SIZE = 32
+
+# Wordlists at least this long are expanded in a process pool
+PARALLEL_THRESHOLD = 5000
+
 # Database setup
 Base = declarative_base()
 
@@ -58,7 +167,15 @@ class WordVariant(Base):
     id = Column(Integer, primary_key=True)
     base = Column(String)
     variant = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime)  # set once per batch by _save_database
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable WAL journaling and relaxed syncing on every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
 
 
 class CruchError(Exception):
@@ -72,12 +189,14 @@ class SubroutineHandler:
     def __init__(self):
         self.engine = None
         self.session = None
-        self.wordlist_cache: Set[str] = set()
+        # Results of generate_leet_variants, keyed on (wordlist, max_variants)
+        self.wordlist_cache: Dict[tuple, List[str]] = {}
 
     def init_database(self, db_path: str = 'cruch_wordlists.db') -> None:
         """Initialize database connection"""
         try:
             self.engine = create_engine(f'sqlite:///{db_path}')
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
             Base.metadata.create_all(self.engine)
             Session = sessionmaker(bind=self.engine)
             self.session = Session()
@@ -106,38 +225,104 @@ class SubroutineHandler:
 
     def generate_leet_variants(self, wordlist: List[str], max_variants: int = 1000) -> List[str]:
         """Generate leetspeak variants with limit protection"""
+        key = (tuple(wordlist), max_variants)
+        cached = self.wordlist_cache.get(key)
+        if cached is not None:
+            logger.info(f"Reusing {len(cached)} cached variants")
+            return list(cached)
+
         variants = set(wordlist)  # Start with original words
 
         try:
-            for word in wordlist:
-                if len(variants) >= max_variants:
+            if len(variants) >= max_variants:
+                # The seed words already fill the budget: nothing to generate,
+                # and no reason to start a process pool
+                logger.warning(f"Reached max variants limit: {max_variants}")
+                candidates = []
+            else:
+                # Words without any substitutable character cannot add variants
+                candidates = _words_with_substitutions(wordlist)
+            n = len(candidates)
+
+            # Each word gets an equal share of the budget, so one word with a
+            # huge product cannot crowd out the words after it
+            remaining = max_variants - len(variants)
+            per_word = max(1, remaining // n) if n else 0
+
+            if n >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+                # If the cap can be hit, keep input order so the same words get variants every run
+                results = self._iter_variants_parallel(candidates, per_word, ordered=per_word * n > remaining)
+            else:
+                results = (self._generate_word_variants(word, per_word) for word in candidates)
+
+            # Per-word frozensets are merged in one set.update(*pending) call;
+            # bound is an upper limit on the merged size (duplicates included)
+            pending = []
+            bound = len(variants)
+
+            for i, word_variants in enumerate(results):
+                if bound + len(word_variants) > max_variants:
+                    # Might overshoot: merge what is pending for the exact size
+                    variants.update(*pending)
+                    pending.clear()
+                    bound = len(variants)
+
+                if bound >= max_variants:
                     logger.warning(f"Reached max variants limit: {max_variants}")
                     break
 
-                word_variants = self._generate_word_variants(word)
-                variants.update(word_variants)
+                if bound + len(word_variants) <= max_variants:
+                    pending.append(word_variants)
+                    bound += len(word_variants)
+                else:
+                    # Would overshoot: add one by one and stop exactly at the cap
+                    for variant in word_variants:
+                        variants.add(variant)
+                        if len(variants) >= max_variants:
+                            break
+                    bound = len(variants)
 
                 # Progress logging for large wordlists
-                if len(wordlist) > 100 and wordlist.index(word) % 50 == 0:
-                    logger.info(f"Processed {wordlist.index(word)}/{len(wordlist)} words")
+                if n > 100 and i % 50 == 0:
+                    logger.info(f"Processed {i}/{n} words")
 
+            variants.update(*pending)
             logger.info(f"Generated {len(variants)} total variants")
-            return list(variants)
+            result = list(variants)
+            if len(self.wordlist_cache) >= WORDLIST_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.wordlist_cache[next(iter(self.wordlist_cache))]
+            self.wordlist_cache[key] = result
+            return list(result)
         except Exception as e:
             raise CruchError(f"Leet variant generation failed: {e}")
 
-    def _generate_word_variants(self, word: str) -> Set[str]:
-        """Generate all possible leet variants for a single word"""
-        variants = set()
+    def _iter_variants_parallel(self, wordlist: List[str], limit: int,
+                                ordered: bool = False) -> Iterator[FrozenSet[str]]:
+        """Yield per-word variant sets computed across a process pool
+
+        With ordered=True results arrive in wordlist order (imap), otherwise
+        as soon as they are ready (imap_unordered).
+        """
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(wordlist) // (8 * workers))
+        worker = functools.partial(_generate_word_variants, limit=limit)
+
+        # Leaving the with-block (also on early break) terminates the pool
+        with multiprocessing.Pool(workers) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            yield from imap(worker, wordlist, chunksize=chunksize)
 
-        # Generate character-by-character substitutions
-        for i, char in enumerate(word):
-            if char.lower() in LEET_DICT:
-                for replacement in LEET_DICT[char.lower()]:
-                    variant = word[:i] + replacement + word[i + 1:]
-                    variants.add(variant)
+    # Module-level so worker processes can unpickle it
+    _generate_word_variants = staticmethod(_generate_word_variants)
 
-        return variants
+    def generate_leet_case_variants(self, wordlist: List[str], max_variants: int = 1000) -> List[str]:
+        """Generate leet variants, then case mutations of the result
+
+        Same output as running the two stages one after the other; the leet
+        stage is budgeted per word and reuses the wordlist cache.
+        """
+        return self.apply_case_mutations(self.generate_leet_variants(wordlist, max_variants))
 
     def apply_case_mutations(self, wordlist: List[str]) -> List[str]:
         """Apply case mutations to wordlist"""
@@ -152,102 +337,142 @@ class SubroutineHandler:
                 mutated.add(word.title())
 
                 # Add character-by-character case swapping
-                for i in range(len(word)):
-                    chars = list(word)
-                    chars[i] = chars[i].swapcase()
-                    mutated.add(''.join(chars))
+                if word.isascii():
+                    # ASCII letters flip case with a single XOR 0x20, done in place
+                    buf = bytearray(word, 'ascii')
+                    for i, c in enumerate(buf):
+                        if 0x61 <= (c | 0x20) <= 0x7a:
+                            buf[i] = c ^ 0x20
+                            mutated.add(buf.decode('ascii'))
+                            buf[i] = c
+                else:
+                    for i in range(len(word)):
+                        chars = list(word)
+                        chars[i] = chars[i].swapcase()
+                        mutated.add(''.join(chars))
 
             logger.info(f"Applied case mutations: {len(mutated)} total variants")
             return list(mutated)
         except Exception as e:
             raise CruchError(f"Case mutation failed: {e}")
 
-    def generate_crunch_patterns(self, min_len: int, max_len: int, charset: str = None) -> List[str]:
-        """Generate crunch-like patterns"""
+    def iter_crunch_patterns(self, min_len: int, max_len: int, charset: str = None) -> Iterator[str]:
+        """Lazily yield crunch-like patterns"""
         if not charset:
             charset = string.ascii_lowercase + string.digits
 
-        patterns = []
+        for length in range(min_len, max_len + 1):
+            for pattern in itertools.product(charset, repeat=length):
+                yield ''.join(pattern)
 
+    def generate_crunch_patterns(self, min_len: int, max_len: int, charset: str = None,
+                                 limit: int = 10000) -> List[str]:
+        """Generate crunch-like patterns"""
         try:
-            for length in range(min_len, max_len + 1):
-                if length > 4:  # Prevent memory issues
-                    logger.warning(f"Skipping length {length} to prevent memory issues")
-                    continue
-
-                for pattern in itertools.product(charset, repeat=length):
-                    patterns.append(''.join(pattern))
+            patterns = list(itertools.islice(
+                self.iter_crunch_patterns(min_len, max_len, charset), limit))
 
-                    if len(patterns) >= 10000:  # Limit to prevent memory issues
-                        logger.warning("Reached pattern generation limit")
-                        return patterns
+            if len(patterns) >= limit:  # Limit to prevent memory issues
+                logger.warning("Reached pattern generation limit")
 
             logger.info(f"Generated {len(patterns)} crunch patterns")
             return patterns
         except Exception as e:
             raise CruchError(f"Crunch pattern generation failed: {e}")
 
-    def save_wordlist(self, wordlist: List[str], output_format: str, output_file: str = None,
-                      base_word: str = "unknown") -> None:
-        """Save wordlist in specified format"""
+    def save_wordlist(self, wordlist: Iterable[str], output_format: str, output_file: str = None,
+                      base_word: str = "unknown", sort: Optional[bool] = None) -> None:
+        """Save wordlist in specified format
+
+        sort=None sorts only JSON and CSV output; txt and db consumers
+        (hashcat, hydra, ffuf, ...) do not care about order.
+        """
         try:
+            # Deduplicate once for all output formats, sort only if needed
+            unique = set(wordlist)
+            if sort is None:
+                sort = output_format.lower() in ('json', 'csv')
+            if sort:
+                unique = sorted(unique)
+
             if output_format.lower() == 'json':
-                self._save_json(wordlist, output_file, base_word)
+                self._save_json(unique, output_file, base_word)
             elif output_format.lower() == 'csv':
-                self._save_csv(wordlist, output_file, base_word)
+                self._save_csv(unique, output_file, base_word)
             elif output_format.lower() == 'db':
-                self._save_database(wordlist, base_word)
+                self._save_database(unique, base_word)
             else:
-                self._save_text(wordlist, output_file)
+                self._save_text(unique, output_file)
 
             logger.info(f"Wordlist saved in {output_format} format")
         except Exception as e:
             raise CruchError(f"Failed to save wordlist: {e}")
 
-    def _save_json(self, wordlist: List[str], output_file: str, base_word: str) -> None:
+    def _save_json(self, wordlist: Collection[str], output_file: str, base_word: str) -> None:
         """Save as JSON format"""
         data = {
             "base_word": base_word,
             "generated_at": datetime.utcnow().isoformat(),
             "count": len(wordlist),
-            "variants": sorted(set(wordlist))
         }
 
         output_file = output_file or f"{base_word}_variants.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            if len(wordlist) <= JSON_STREAM_THRESHOLD:
+                data["variants"] = list(wordlist)
+                if orjson is not None:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+                return
 
-    def _save_csv(self, wordlist: List[str], output_file: str, base_word: str) -> None:
+            # Large lists: compact output, variants encoded chunk by chunk so
+            # the whole document never exists as one string in memory
+            head = json.dumps(data, ensure_ascii=False)[:-1]
+            f.write(f'{head}, "variants": ['.encode('utf-8'))
+            words = iter(wordlist)
+            separator = b''
+            for chunk in iter(lambda: list(itertools.islice(words, WRITE_BATCH_ITEMS)), []):
+                if orjson is not None:
+                    encoded = orjson.dumps(chunk)[1:-1]
+                else:
+                    encoded = json.dumps(chunk, ensure_ascii=False)[1:-1].encode('utf-8')
+                f.write(separator + encoded)
+                separator = b','
+            f.write(b']}')
+
+    def _save_csv(self, wordlist: Collection[str], output_file: str, base_word: str) -> None:
         """Save as CSV format"""
         output_file = output_file or f"{base_word}_variants.csv"
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['Base', 'Variant', 'Length', 'Generated_At'])
             timestamp = datetime.utcnow().isoformat()
 
-            for word in sorted(set(wordlist)):
-                writer.writerow([base_word, word, len(word), timestamp])
+            rows = ([base_word, word, len(word), timestamp] for word in wordlist)
+            for batch in iter(lambda: list(itertools.islice(rows, WRITE_BATCH_ITEMS)), []):
+                writer.writerows(batch)
 
-    def _save_database(self, wordlist: List[str], base_word: str) -> None:
+    def _save_database(self, wordlist: Collection[str], base_word: str) -> None:
         """Save to database"""
         if not self.session:
             self.init_database()
 
-        for word in set(wordlist):
-            entry = WordVariant(base=base_word, variant=word)
-            self.session.add(entry)
-
+        # Bulk insert bypasses the per-instance ORM unit-of-work overhead
+        ts = datetime.utcnow()
+        rows = [{'base': base_word, 'variant': word, 'created_at': ts} for word in wordlist]
+        self.session.bulk_insert_mappings(WordVariant, rows)
         self.session.commit()
 
-    def _save_text(self, wordlist: List[str], output_file: str) -> None:
+    def _save_text(self, wordlist: Collection[str], output_file: str) -> None:
         """Save as plain text"""
+        # Streamed through a large buffer; never builds the whole text in memory
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for word in sorted(set(wordlist)):
-                    f.write(f"{word}\n")
+            with open(output_file, 'w', encoding='utf-8', newline='\n',
+                      buffering=WRITE_BUFFER_SIZE) as f:
+                f.writelines(word + '\n' for word in wordlist)
         else:
-            for word in sorted(set(wordlist)):
-                print(word)
+            sys.stdout.writelines(word + '\n' for word in wordlist)
 
 
 class CruchWrapper:
@@ -288,6 +513,11 @@ Examples:
         parser.add_argument('--output-format', choices=['txt', 'json', 'csv', 'db'],
                             default='txt', help='Output format')
         parser.add_argument('--output', '-o', help='Output file path')
+        sort_group = parser.add_mutually_exclusive_group()
+        sort_group.add_argument('--sorted', dest='sort', action='store_const', const=True,
+                                help='Sort output (default for json/csv)')
+        sort_group.add_argument('--unsorted', dest='sort', action='store_const', const=False,
+                                help='Skip sorting output (default for txt/db)')
 
         # Tool integration
         parser.add_argument('--recon-hooks', action='store_true',
@@ -305,13 +535,25 @@ Examples:
 
         return parser.parse_args()
 
+    def _setup_logging(self, verbose: bool) -> None:
+        """Configure logging for CLI use (library imports stay handler-free)"""
+        logging.basicConfig(
+            level=logging.DEBUG if verbose else logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('cruch.log'),
+                logging.StreamHandler()
+            ]
+        )
+
     def generate_jtr_rules(self, num_chars: int) -> None:
         """Generate John the Ripper rules"""
-        print('[List.Rules:CruchWordlist]')
-        for key in LEET_DICT.keys():
-            for val in LEET_DICT[key]:
-                for i in range(int(num_chars)):
-                    print(f'={i}{key}o{i}{val}')
+        lines = ['[List.Rules:CruchWordlist]']
+        positions = range(int(num_chars))
+        for key, vals in LEET_DICT.items():
+            for val in vals:
+                lines.extend(f'={i}{key}o{i}{val}' for i in positions)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def show_leet_dictionary(self) -> None:
         """Display the leetspeak dictionary"""
@@ -348,9 +590,7 @@ Examples:
         """Main execution method"""
         try:
             self.args = self.parse_arguments()
-
-            if self.args.verbose:
-                logging.getLogger().setLevel(logging.DEBUG)
+            self._setup_logging(self.args.verbose)
 
             # Handle utility functions
             if self.args.view_dict:
@@ -385,17 +625,21 @@ Examples:
                 raise CruchError("No words loaded or generated")
 
             # Apply transformations
-            if self.args.leet:
+            if self.args.leet and self.args.case:
+                wordlist = self.handler.generate_leet_case_variants(
+                    wordlist, self.args.max_variants
+                )
+            elif self.args.leet:
                 wordlist = self.handler.generate_leet_variants(
                     wordlist, self.args.max_variants
                 )
-
-            if self.args.case:
+            elif self.args.case:
                 wordlist = self.handler.apply_case_mutations(wordlist)
 
             # Save output
             self.handler.save_wordlist(
-                wordlist, self.args.output_format, self.args.output, base_word
+                wordlist, self.args.output_format, self.args.output, base_word,
+                sort=self.args.sort
             )
 
             # Generate integration hooks if requested
@@ -1,33 +1,199 @@
 import re
+import bisect
+import functools
 import ipaddress
-from typing import Union, Optional, List, Pattern
-from urllib.parse import urlparse
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Union, Optional, List, Pattern, Tuple
+from urllib.parse import urlsplit
+
+# Optional DFA regex engines (linear time, no backtracking)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Patterns are compiled once at import time and shared by all validator instances.
+# They avoid lookarounds and named groups so DFA engines can compile them too.
+# Single domain label: alphanumeric at both ends, max 63 characters
+_LABEL_RE = re.compile(r"[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?")
+
+# TLD (2-63 letters)
+_TLD_RE = re.compile(r"[a-zA-Z]{2,63}")
+
+# Whole-name form of the per-label checks, used for bulk filtering where
+# no failure reason is reported
+_DOMAIN_RE = re.compile(r"^(?:" + _LABEL_RE.pattern + r"\.)+" + _TLD_RE.pattern + r"\.?$")
+
+_URL_RE = re.compile(
+    r"^(?:(?:https?|ftps?)://)?"  # Optional scheme
+    # Domain name or IP
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+"
+    r"(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # Domain
+    r"localhost|"  # Localhost
+    r"\[[0-9a-f:]+\]|"  # IPv6
+    r"(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}"
+    r"(?:25[0-5]|2[0-4]\d|[01]?\d\d?))"  # IPv4
+    r"(?::\d+)?"  # Optional port
+    r"(?:/?|[/?]\S+)$",  # Path
+    re.IGNORECASE
+)
+
+# More permissive regex for international emails
+_EMAIL_INTL_RE = re.compile(
+    r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
+)
+
+# Standard ASCII-only email regex
+_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
+)
+
+
+def _thread_scratch(db) -> Callable[[], 'hyperscan.Scratch']:
+    """
+    Return a getter for a per-thread Hyperscan scratch space of db.
+
+    A database's own scratch can only serve one scan at a time, so threads
+    sharing a compiled database each need their own.
+    """
+    local = threading.local()
+
+    def get_scratch() -> 'hyperscan.Scratch':
+        scratch = getattr(local, 'scratch', None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(db)
+        return scratch
+
+    return get_scratch
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_matcher(pattern: Pattern) -> Callable[[str], bool]:
+    """
+    Build a match function for a compiled pattern.
+
+    Uses Hyperscan or RE2 when installed and able to compile the pattern,
+    falling back to the stdlib regex engine. All engines share re.match
+    semantics, i.e. a match must start at the beginning of the value.
+    """
+    if hyperscan is not None:
+        flags = hyperscan.HS_FLAG_SINGLEMATCH
+        if pattern.flags & re.IGNORECASE:
+            flags |= hyperscan.HS_FLAG_CASELESS
+        if not pattern.flags & re.ASCII:
+            # str patterns are Unicode-aware in re (e.g. \d matches '１')
+            flags |= hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        # Hyperscan reports matches anywhere; anchor like re.match does
+        expression = '^(?:' + pattern.pattern + ')'
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(expressions=[expression.encode('utf-8')], ids=[0], flags=[flags])
+        except hyperscan.error:
+            pass
+        else:
+            get_scratch = _thread_scratch(db)
+
+            def hs_match(value: str) -> bool:
+                found = []
+                db.scan(value.encode('utf-8'), match_event_handler=lambda *args: found.append(True),
+                        scratch=get_scratch())
+                return bool(found)
+            return hs_match
+
+    if re2 is not None:
+        prefix = '(?i)' if pattern.flags & re.IGNORECASE else ''
+        try:
+            compiled = re2.compile(prefix + pattern.pattern)
+        except re2.error:
+            pass
+        else:
+            return lambda value: compiled.match(value) is not None
+
+    return lambda value: pattern.match(value) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_batch_scanner(pattern: Pattern) -> Optional[Callable[[List[str]], bytearray]]:
+    """
+    Build a Hyperscan scanner that matches many lines in a single call.
+
+    The returned function takes newline-free strings and returns a bytearray
+    with 1 for every line the pattern matches. Returns None when Hyperscan
+    is unavailable or cannot compile the pattern.
+    """
+    if hyperscan is None:
+        return None
+
+    flags = hyperscan.HS_FLAG_MULTILINE
+    if pattern.flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(expressions=[pattern.pattern.encode('utf-8')], ids=[0], flags=[flags])
+    except hyperscan.error:
+        return None
+
+    get_scratch = _thread_scratch(db)
+
+    def scan(lines: List[str]) -> bytearray:
+        encoded = [line.encode('utf-8') for line in lines]
+        starts = []
+        offset = 0
+        for line in encoded:
+            starts.append(offset)
+            offset += len(line) + 1
+
+        hits = bytearray(len(lines))
+
+        def on_match(id_, from_, to, flags, context):
+            hits[bisect.bisect_right(starts, max(to - 1, 0)) - 1] = 1
+
+        db.scan(b'\n'.join(encoded), match_event_handler=on_match, scratch=get_scratch())
+        return hits
+
+    return scan
 
 
 class ValidationException(Exception):
     """Exception raised when validation fails."""
 
     def __init__(self, input_value: str, validator: str, details: Optional[str] = None):
+        super().__init__(input_value, validator, details)
         self.input_value = input_value
         self.validator = validator
         self.details = details
 
-        message = f"Input failed {validator} validation: {input_value}"
-        if details:
-            message += f" ({details})"
+    def __str__(self) -> str:
+        # Formatted on demand, so raising and discarding stays cheap
+        message = f"Input failed {self.validator} validation: {self.input_value}"
+        if self.details:
+            message += f" ({self.details})"
+        return message
 
-        super().__init__(message)
+
+# Result of a successful _check()
+_VALID = (True, None)
 
 
 class BaseValidator:
     """Base class for all input validators."""
 
-    def __init__(self, regex: Union[str, Pattern], validator: Optional[str] = None, flags: int = 0):
+    def __init__(self, regex: Optional[Union[str, Pattern]], validator: Optional[str] = None, flags: int = 0):
         """
         Initialize the validator.
 
         Args:
-            regex: Regular expression pattern (string or compiled)
+            regex: Regular expression pattern (string or compiled), or None
+                   for validators that override _check() without a regex
             validator: Name of the validator for error messages
             flags: Regex compilation flags
         """
@@ -35,8 +201,46 @@ class BaseValidator:
             self.match_object = re.compile(regex, flags)
         else:
             self.match_object = regex
+        self._matches = _compile_matcher(self.match_object) if self.match_object is not None else None
         self.validator = validator or self.__class__.__name__.replace('Validator', '').lower()
 
+    def _check(self, value: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check the input value without raising.
+
+        Args:
+            value: Input string to check
+
+        Returns:
+            tuple: (ok, reason) where reason describes a failure, if known
+        """
+        if not isinstance(value, str):
+            return False, "Input must be a string"
+
+        stripped = value.strip()
+        if not stripped:
+            return False, "Input cannot be empty"
+
+        return self._check_stripped(value, stripped)
+
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check an input whose surrounding whitespace has already been removed.
+
+        Subclasses extend this hook; `value` is only kept for error messages.
+
+        Args:
+            value: Original input string
+            stripped: value.strip(), computed once by the caller
+
+        Returns:
+            tuple: (ok, reason) where reason describes a failure, if known
+        """
+        if not self._matches(stripped):
+            return False, None
+
+        return _VALID
+
     def validate(self, value: str) -> None:
         """
         Validate the input value.
@@ -47,14 +251,26 @@ class BaseValidator:
         Raises:
             ValidationException: If validation fails
         """
-        if not isinstance(value, str):
-            raise ValidationException(str(value), self.validator, "Input must be a string")
+        ok, reason = self._check(value)
+        if not ok:
+            raise ValidationException(value if isinstance(value, str) else str(value),
+                                      self.validator, reason)
 
-        if not value.strip():
-            raise ValidationException(value, self.validator, "Input cannot be empty")
+    def validate_trimmed(self, value: str) -> None:
+        """
+        Validate a non-empty string the caller has already stripped.
 
-        if self.match_object.match(value.strip()) is None:
-            raise ValidationException(value, self.validator)
+        Skips the type check and the strip() of validate().
+
+        Args:
+            value: Stripped input string to validate
+
+        Raises:
+            ValidationException: If validation fails
+        """
+        ok, reason = self._check_stripped(value, value)
+        if not ok:
+            raise ValidationException(value, self.validator, reason)
 
     def is_valid(self, value: str) -> bool:
         """
@@ -66,11 +282,7 @@ class BaseValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            self.validate(value)
-            return True
-        except ValidationException:
-            return False
+        return self._check(value)[0]
 
     def filter_valid(self, values: List[str]) -> List[str]:
         """
@@ -82,46 +294,109 @@ class BaseValidator:
         Returns:
             List[str]: List containing only valid values
         """
-        return [value for value in values if self.is_valid(value)]
+        scanner = _compile_batch_scanner(self.match_object) if self.match_object is not None else None
+        if scanner is None:
+            return [value for value in values if self.is_valid(value)]
+
+        # One batched scan rejects everything the pattern cannot match;
+        # survivors still run the full validation (subclass checks included)
+        lines = []
+        positions = []
+        for i, value in enumerate(values):
+            if isinstance(value, str):
+                stripped = value.strip()
+                if stripped and '\n' not in stripped:
+                    lines.append(stripped)
+                    positions.append(i)
+
+        batched = dict(zip(positions, zip(lines, scanner(lines))))
+        valid = []
+        for i, value in enumerate(values):
+            entry = batched.get(i)
+            if entry is None:
+                if self.is_valid(value):
+                    valid.append(value)
+            elif entry[1] and self._check_stripped(value, entry[0])[0]:
+                valid.append(value)
+        return valid
+
+    def filter_valid_parallel(self, values: List[str], workers: Optional[int] = None,
+                              chunk: int = 4096, processes: Optional[bool] = None) -> List[str]:
+        """
+        Filter a large list across several workers, preserving order.
+
+        Args:
+            values: List of strings to filter
+            workers: Number of workers (default: executor default)
+            chunk: Number of values handed to a worker at a time
+            processes: Use processes instead of threads; by default processes
+                       are used unless a DFA engine (Hyperscan/RE2) is installed,
+                       which matches without holding the GIL
+
+        Returns:
+            List[str]: List containing only valid values
+        """
+        if len(values) <= chunk:
+            return self.filter_valid(values)
+
+        if processes is None:
+            processes = hyperscan is None and re2 is None
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+        chunks = [values[i:i + chunk] for i in range(0, len(values), chunk)]
+        with executor_class(max_workers=workers) as executor:
+            results = executor.map(_filter_chunk, itertools.repeat(self), chunks)
+            return [value for part in results for value in part]
+
+    def __getstate__(self) -> dict:
+        # Matcher closures cannot be pickled; they are rebuilt from match_object
+        state = self.__dict__.copy()
+        state.pop('_matches', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._matches = _compile_matcher(self.match_object) if self.match_object is not None else None
+
+
+def _filter_chunk(validator: BaseValidator, values: List[str]) -> List[str]:
+    """Worker entry point for BaseValidator.filter_valid_parallel."""
+    return validator.filter_valid(values)
 
 
 class DomainValidator(BaseValidator):
     """Validator for domain names."""
 
     def __init__(self):
-        # Enhanced domain regex with better subdomain support
-        regex = (
-            r"^(?=.{1,253}\.?$)"  # Total length check
-            r"(?!"  # Negative lookahead for invalid patterns
-            r".*\.\d+$|"  # Not ending with .<number>
-            r".*\.$\."  # Not ending with multiple dots
-            r")"
-            r"(?:"
-            r"[a-zA-Z0-9]"  # First character must be alphanumeric
-            r"[a-zA-Z0-9\-]{0,61}"  # Middle characters (max 63 per label)
-            r"[a-zA-Z0-9]"  # Last character must be alphanumeric
-            r"\."  # Dot separator
-            r")+"
-            r"[a-zA-Z]{2,63}\.?$"  # TLD (2-63 characters, optional trailing dot)
-        )
-        super().__init__(regex, 'domain')
+        # Validated label by label in a single pass, no combined regex
+        super().__init__(None, 'domain')
 
-    def validate(self, value: str) -> None:
-        """Enhanced domain validation with additional checks."""
-        super().validate(value)
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
+        """Enhanced domain validation with per-label checks."""
+        # Total length check (253 characters plus an optional trailing dot)
+        if len(stripped) - stripped.endswith('.') > 253:
+            return False, "Domain exceeds 253 characters"
 
-        # Additional checks
-        domain = value.strip().rstrip('.')
-        labels = domain.split('.')
+        domain = stripped[:-1] if stripped.endswith('.') else stripped
+        *labels, tld = domain.split('.')
+        if not labels or not _TLD_RE.fullmatch(tld):
+            return False, None
 
         # Check individual label constraints
         for label in labels:
+            if _LABEL_RE.fullmatch(label):
+                continue
             if len(label) > 63:
-                raise ValidationException(value, self.validator,
-                                          f"Label '{label}' exceeds 63 characters")
+                return False, f"Label '{label}' exceeds 63 characters"
             if label.startswith('-') or label.endswith('-'):
-                raise ValidationException(value, self.validator,
-                                          f"Label '{label}' cannot start or end with hyphen")
+                return False, f"Label '{label}' cannot start or end with hyphen"
+            return False, None
+
+        return _VALID
+
+    def filter_valid(self, values: List[str]) -> List[str]:
+        """Filter a list to return only valid domains (see filter_domains)."""
+        return filter_domains(values)
 
 
 class UrlValidator(BaseValidator):
@@ -137,50 +412,33 @@ class UrlValidator(BaseValidator):
         self.allowed_schemes = schemes or ['http', 'https', 'ftp', 'ftps']
 
         # Comprehensive URL regex
-        regex = (
-            r"^(?:(?P<scheme>https?|ftps?)://)?"  # Optional scheme
-            r"(?:"
-            # Domain name or IP
-            r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+"
-            r"(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # Domain
-            r"localhost|"  # Localhost
-            r"\[[0-9a-f:]+\]|"  # IPv6
-            r"(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}"
-            r"(?:25[0-5]|2[0-4]\d|[01]?\d\d?))"  # IPv4
-            r"(?::\d+)?"  # Optional port
-            r"(?:/?|[/?]\S+)$"  # Path
-        )
-        super().__init__(regex, 'url', re.IGNORECASE)
+        super().__init__(_URL_RE, 'url')
 
-    def validate(self, value: str) -> None:
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
         """Enhanced URL validation with security checks."""
-        super().validate(value)
+        result = super()._check_stripped(value, stripped)
+        if not result[0]:
+            return result
 
-        url = value.strip()
+        url = stripped
 
         # Parse URL for additional validation
         try:
-            parsed = urlparse(url if '://' in url else f'http://{url}')
+            parsed = urlsplit(url) if '://' in url else urlsplit('http://' + url)
         except Exception:
-            raise ValidationException(value, self.validator, "Unable to parse URL")
+            return False, "Unable to parse URL"
 
         # Scheme validation
         if parsed.scheme and parsed.scheme.lower() not in self.allowed_schemes:
-            raise ValidationException(value, self.validator,
-                                      f"Scheme '{parsed.scheme}' not allowed")
+            return False, f"Scheme '{parsed.scheme}' not allowed"
 
-        # Security checks
-        if parsed.hostname:
-            # Check for suspicious patterns
-            suspicious_patterns = [
-                r'xn--',  # Punycode (potential IDN homograph attack)
-                r'[^\x00-\x7F]',  # Non-ASCII characters
-            ]
+        # Security checks: non-ASCII characters or punycode (potential IDN
+        # homograph attack); isascii() and the substring test both run in C
+        hostname = parsed.hostname
+        if hostname and (not hostname.isascii() or 'xn--' in hostname):
+            return False, "Potentially malicious hostname detected"
 
-            for pattern in suspicious_patterns:
-                if re.search(pattern, parsed.hostname):
-                    raise ValidationException(value, self.validator,
-                                              "Potentially malicious hostname detected")
+        return _VALID
 
 
 class EmailValidator(BaseValidator):
@@ -194,48 +452,39 @@ class EmailValidator(BaseValidator):
             allow_smtputf8: Allow international characters (SMTPUTF8)
         """
         self.allow_smtputf8 = allow_smtputf8
+        super().__init__(_EMAIL_INTL_RE if allow_smtputf8 else _EMAIL_RE, 'email')
 
-        if allow_smtputf8:
-            # More permissive regex for international emails
-            regex = r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-        else:
-            # Standard ASCII-only email regex
-            regex = (
-                r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
-                r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-                r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-            )
-
-        super().__init__(regex, 'email')
-
-    def validate(self, value: str) -> None:
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
         """Enhanced email validation with length and format checks."""
-        super().validate(value)
+        result = super()._check_stripped(value, stripped)
+        if not result[0]:
+            return result
 
-        email = value.strip().lower()
+        email = stripped.lower()
 
         # Check total length (RFC 5321 limit)
         if len(email) > 254:
-            raise ValidationException(value, self.validator,
-                                      "Email address too long (max 254 characters)")
+            return False, "Email address too long (max 254 characters)"
 
         # Split and validate parts
         try:
             local, domain = email.rsplit('@', 1)
         except ValueError:
-            raise ValidationException(value, self.validator, "Invalid email format")
+            return False, "Invalid email format"
 
         # Local part validation
         if len(local) > 64:
-            raise ValidationException(value, self.validator,
-                                      "Local part too long (max 64 characters)")
+            return False, "Local part too long (max 64 characters)"
 
-        # Domain part validation using DomainValidator
-        domain_validator = DomainValidator()
-        try:
-            domain_validator.validate(domain)
-        except ValidationException:
-            raise ValidationException(value, self.validator, "Invalid domain part")
+        # Domain part validation using the shared DomainValidator
+        if not _domain_validator().is_valid(domain):
+            return False, "Invalid domain part"
+
+        return _VALID
+
+    def filter_valid(self, values: List[str]) -> List[str]:
+        """Filter a list to return only valid emails (see filter_emails)."""
+        return filter_emails(values, international=self.allow_smtputf8)
 
 
 class IPValidator(BaseValidator):
@@ -257,40 +506,46 @@ class IPValidator(BaseValidator):
         self.allow_private = allow_private
         self.allow_loopback = allow_loopback
 
-        # Combine IPv4 and IPv6 patterns
-        patterns = []
-        if allow_ipv4:
-            patterns.append(r"(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)")
-        if allow_ipv6:
-            patterns.append(r"(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|::1|::")
-
-        regex = f"^(?:{'|'.join(patterns)})$" if patterns else "^$"
-        super().__init__(regex, 'ip')
+        # Parsing is left entirely to ipaddress, no regex needed
+        super().__init__(None, 'ip')
 
-    def validate(self, value: str) -> None:
+    def _check(self, value: str) -> Tuple[bool, Optional[str]]:
         """Validate IP address with additional security checks."""
         if not self.allow_ipv4 and not self.allow_ipv6:
-            raise ValidationException(value, self.validator, "No IP versions allowed")
+            return False, "No IP versions allowed"
+
+        return self._check_stripped(value, value.strip())
 
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
+        """Parse the address and apply the version/range restrictions."""
         try:
-            ip_obj = ipaddress.ip_address(value.strip())
+            ip_obj = ipaddress.ip_address(stripped)
         except ValueError:
-            raise ValidationException(value, self.validator, "Invalid IP address format")
+            return False, "Invalid IP address format"
 
         # Version checks
         if isinstance(ip_obj, ipaddress.IPv4Address) and not self.allow_ipv4:
-            raise ValidationException(value, self.validator, "IPv4 addresses not allowed")
+            return False, "IPv4 addresses not allowed"
 
         if isinstance(ip_obj, ipaddress.IPv6Address) and not self.allow_ipv6:
-            raise ValidationException(value, self.validator, "IPv6 addresses not allowed")
+            return False, "IPv6 addresses not allowed"
 
-        # Private address checks
-        if ip_obj.is_private and not self.allow_private:
-            raise ValidationException(value, self.validator, "Private IP addresses not allowed")
+        # Private address checks (is_private walks a network table, so only
+        # evaluate it when the answer matters)
+        if not self.allow_private and ip_obj.is_private:
+            return False, "Private IP addresses not allowed"
 
         # Loopback checks
-        if ip_obj.is_loopback and not self.allow_loopback:
-            raise ValidationException(value, self.validator, "Loopback addresses not allowed")
+        if not self.allow_loopback and ip_obj.is_loopback:
+            return False, "Loopback addresses not allowed"
+
+        return _VALID
+
+    def filter_valid(self, values: List[str]) -> List[str]:
+        """Filter a list to return only valid IP addresses."""
+        if self.allow_ipv4 and self.allow_ipv6 and self.allow_private and self.allow_loopback:
+            return filter_ips(values)
+        return super().filter_valid(values)
 
 
 class PortValidator(BaseValidator):
@@ -310,25 +565,24 @@ class PortValidator(BaseValidator):
         self.max_port = max_port
         self.allow_well_known = allow_well_known
 
-        regex = r"^\d+$"
-        super().__init__(regex, 'port')
+        # Digits are checked with str.isdecimal(), no regex needed
+        super().__init__(None, 'port')
 
-    def validate(self, value: str) -> None:
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
         """Validate port number with range checks."""
-        super().validate(value)
+        # isdecimal() accepts exactly what the former r"^\d+$" did
+        if not stripped.isdecimal():
+            return False, None
 
-        try:
-            port = int(value.strip())
-        except ValueError:
-            raise ValidationException(value, self.validator, "Port must be a number")
+        port = int(stripped)
 
         if port < self.min_port or port > self.max_port:
-            raise ValidationException(value, self.validator,
-                                      f"Port must be between {self.min_port} and {self.max_port}")
+            return False, f"Port must be between {self.min_port} and {self.max_port}"
 
         if not self.allow_well_known and 1 <= port <= 1023:
-            raise ValidationException(value, self.validator,
-                                      "Well-known ports (1-1023) not allowed")
+            return False, "Well-known ports (1-1023) not allowed"
+
+        return _VALID
 
 
 class HashValidator(BaseValidator):
@@ -350,12 +604,15 @@ class HashValidator(BaseValidator):
         """
         self.hash_types = hash_types or list(self.HASH_PATTERNS.keys())
 
-        # Create combined regex pattern
-        patterns = [self.HASH_PATTERNS[ht] for ht in self.hash_types
-                    if ht in self.HASH_PATTERNS]
-        regex = f"^(?:{'|'.join(patterns)})$" if patterns else "^$"
+        # Hex hashes are recognized by length and alphabet, no regex needed
+        super().__init__(None, 'hash')
 
-        super().__init__(regex, 'hash')
+    def _check_stripped(self, value: str, stripped: str) -> Tuple[bool, Optional[str]]:
+        """Accept hex digests of one of the allowed hash types."""
+        hash_type = _hex_hash_type(stripped)
+        if hash_type is None or hash_type not in self.hash_types:
+            return False, None
+        return _VALID
 
     def get_hash_type(self, value: str) -> Optional[str]:
         """
@@ -367,33 +624,143 @@ class HashValidator(BaseValidator):
         Returns:
             str: Hash type name or None if not recognized
         """
-        value = value.strip()
-        for hash_type, pattern in self.HASH_PATTERNS.items():
-            if re.match(pattern, value) and hash_type in self.hash_types:
-                return hash_type
+        hash_type = _hex_hash_type(value.strip())
+        return hash_type if hash_type in self.hash_types else None
+
+
+# Hex digest length -> hash type (matches HashValidator.HASH_PATTERNS)
+_HASH_LENS = {32: 'md5', 40: 'sha1', 64: 'sha256', 128: 'sha512'}
+
+
+def _hex_hash_type(stripped: str) -> Optional[str]:
+    """Return the hash type for a hex digest of known length, or None."""
+    hash_type = _HASH_LENS.get(len(stripped))
+    # isalnum() rules out the whitespace bytes.fromhex() would skip
+    if hash_type is None or not (stripped.isascii() and stripped.isalnum()):
         return None
+    try:
+        bytes.fromhex(stripped)
+    except ValueError:
+        return None
+    return hash_type
 
 
 # Convenience factory functions
+# Validators hold no per-call state, so instances are built once and shared.
+@functools.lru_cache(maxsize=None)
+def _domain_validator() -> DomainValidator:
+    return DomainValidator()
+
+
+@functools.lru_cache(maxsize=None)
+def _url_validator(schemes: Tuple[str, ...]) -> UrlValidator:
+    return UrlValidator(schemes=list(schemes))
+
+
+@functools.lru_cache(maxsize=None)
+def _email_validator(allow_smtputf8: bool) -> EmailValidator:
+    return EmailValidator(allow_smtputf8=allow_smtputf8)
+
+
+@functools.lru_cache(maxsize=None)
+def _public_ip_validator() -> IPValidator:
+    return IPValidator(allow_private=False, allow_loopback=False)
+
+
 def create_domain_validator() -> DomainValidator:
     """Create a standard domain validator."""
-    return DomainValidator()
+    return _domain_validator()
 
 
 def create_url_validator(secure_only: bool = False) -> UrlValidator:
     """Create a URL validator with optional security restrictions."""
-    schemes = ['https'] if secure_only else ['http', 'https', 'ftp', 'ftps']
-    return UrlValidator(schemes=schemes)
+    schemes = ('https',) if secure_only else ('http', 'https', 'ftp', 'ftps')
+    return _url_validator(schemes)
 
 
 def create_email_validator(international: bool = False) -> EmailValidator:
     """Create an email validator with optional international support."""
-    return EmailValidator(allow_smtputf8=international)
+    return _email_validator(bool(international))
 
 
 def create_public_ip_validator() -> IPValidator:
     """Create an IP validator that only allows public addresses."""
-    return IPValidator(allow_private=False, allow_loopback=False)
+    return _public_ip_validator()
+
+
+# Bulk filtering fast paths
+# These accept exactly what the matching validators accept, but run one tight
+# loop per list instead of a validator call (and failure tuple) per value.
+def filter_domains(values: Iterable[str]) -> List[str]:
+    """
+    Return the values that DomainValidator accepts.
+
+    Args:
+        values: Strings to filter
+
+    Returns:
+        List[str]: Valid domains, in input order
+    """
+    matches = _compile_matcher(_DOMAIN_RE)
+    valid = []
+    append = valid.append
+    for value in values:
+        if isinstance(value, str):
+            stripped = value.strip()
+            if matches(stripped) and len(stripped) - stripped.endswith('.') <= 253:
+                append(value)
+    return valid
+
+
+def filter_emails(values: Iterable[str], international: bool = False) -> List[str]:
+    """
+    Return the values that EmailValidator accepts.
+
+    Args:
+        values: Strings to filter
+        international: Same as EmailValidator(allow_smtputf8=...)
+
+    Returns:
+        List[str]: Valid emails, in input order
+    """
+    matches = _compile_matcher(_EMAIL_INTL_RE if international else _EMAIL_RE)
+    domain_matches = _compile_matcher(_DOMAIN_RE)
+    valid = []
+    append = valid.append
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        stripped = value.strip()
+        if len(stripped) > 254 or not matches(stripped):
+            continue
+        local, domain = stripped.rsplit('@', 1)
+        if len(local) <= 64 and domain_matches(domain) and len(domain) <= 253:
+            append(value)
+    return valid
+
+
+def filter_ips(values: Iterable[str]) -> List[str]:
+    """
+    Return the values that a default IPValidator accepts.
+
+    Args:
+        values: Strings to filter
+
+    Returns:
+        List[str]: Valid IPv4/IPv6 addresses, in input order
+    """
+    ip_address = ipaddress.ip_address
+    valid = []
+    append = valid.append
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        try:
+            ip_address(value.strip())
+        except ValueError:
+            continue
+        append(value)
+    return valid
 
 
 # Validation helper functions
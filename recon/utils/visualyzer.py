@@ -10,24 +10,73 @@ m4tth4ck
 # Imports
 # ===========================
 import pygame
+import functools
+import hashlib
+import itertools
 import math
 import random
 import json
 import logging
+import mmap
 import os
+import pickle
+import queue
+import re
+import struct
+import threading
 import csv
 import sqlite3
 import psycopg2
 import sqlalchemy
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
-from enum import Enum
+from enum import IntEnum
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from scapy.all import rdpcap
+from scapy.utils import PcapReader
 import xml.etree.ElementTree as ET
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: persistenter Ladecache (Fallback: einzelne Pickle-Dateien)
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Optional: vektorisierte Klassifikation vieler Knoten (Fallback: Einzelaufrufe)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Optional: schneller JSON-Parser (Fallback: json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: mehrthreadige CSV-Parser, polars vor pyarrow (Fallback: csv.DictReader)
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# Bevorzugter CSV-Parser, Teil des Ladecache-Schlüssels von load_csv_file
+CSV_BACKEND = 'polars' if pl is not None else 'pyarrow' if pacsv is not None else 'csv'
 
 # ===========================
 # Framework Core Utilities
@@ -37,14 +86,25 @@ class CLIStatus:
     def print_status(message: str):
         print(f"[STATUS] {message}")
 
-@dataclass
+@dataclass(frozen=True)
 class Color:
+    # Feste Slots statt __dict__ (dataclass(slots=True) erst ab Python 3.10)
+    __slots__ = ('r', 'g', 'b', '_rgb')
+
     r: int
     g: int
     b: int
 
+    def __post_init__(self):
+        # Tupel einmalig anlegen statt bei jedem Zeichnen neu
+        object.__setattr__(self, '_rgb', (self.r, self.g, self.b))
+
+    @property
+    def rgb(self) -> Tuple[int, int, int]:
+        return self._rgb
+
     def to_tuple(self) -> Tuple[int, int, int]:
-        return (self.r, self.g, self.b)
+        return self._rgb
 
 # ===========================
 # Logging Setup
@@ -56,6 +116,25 @@ logger = logging.getLogger(__name__)
 # Config Loading
 # ===========================
 CONFIG_PATH = "config.json"
+
+# Ab dieser Größe wird JSON per mmap direkt aus dem Page-Cache geparst
+JSON_MMAP_THRESHOLD = 64 << 20
+
+# Lesepuffer der Dateilader: weniger read()-Syscalls als mit den Standard-8-KiB
+LOADER_BUFFER_SIZE = 1 << 20
+
+def _read_json(filepath):
+    if orjson is None:
+        with open(filepath, 'r', buffering=LOADER_BUFFER_SIZE) as f:
+            return json.load(f)
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < JSON_MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        # Keine Zwischenkopie der Datei als bytes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+@functools.lru_cache(maxsize=None)
 def load_config():
     default_config = {
         "window_width": 1200,
@@ -66,28 +145,80 @@ def load_config():
     }
     if os.path.exists(CONFIG_PATH):
         try:
-            with open(CONFIG_PATH, 'r') as f:
-                user_config = json.load(f)
+            user_config = _read_json(CONFIG_PATH)
             default_config.update(user_config)
         except Exception as e:
             logger.error(f"Fehler beim Laden der Konfiguration: {e}")
     return default_config
 
-config = load_config()
-WINDOW_WIDTH = config['window_width']
-WINDOW_HEIGHT = config['window_height']
-BACKGROUND_COLOR = tuple(config['background_color'])
-FPS = config['fps']
-NAMING_SCHEME = config['naming_scheme']
+# Konfigurationswerte als Modulattribute, erst beim ersten Zugriff geladen (PEP 562)
+_CONFIG_ATTRS = {
+    'WINDOW_WIDTH': 'window_width',
+    'WINDOW_HEIGHT': 'window_height',
+    'BACKGROUND_COLOR': 'background_color',
+    'FPS': 'fps',
+    'NAMING_SCHEME': 'naming_scheme'
+}
+
+def __getattr__(name):
+    if name == 'config':
+        return load_config()
+    key = _CONFIG_ATTRS.get(name)
+    if key is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = load_config()[key]
+    return tuple(value) if name == 'BACKGROUND_COLOR' else value
 
 # ===========================
 # Node Typisierung und Farbschema
 # ===========================
-class NodeType(Enum):
-    PLANET = "planet"
-    MOON = "moon"
-    STAR = "star"
-    ASTEROID = "asteroid"
+class NodeType(IntEnum):
+    # Ganzzahlig, damit ein Typ direkt als Index in NODE_COLOR_ARRAY dient
+    STAR = 0
+    PLANET = 1
+    MOON = 2
+    ASTEROID = 3
+
+# Farbe je NodeType, einmal auf Modulebene statt pro Aufruf
+_NODE_COLORS = {
+    NodeType.STAR: Color(255, 255, 100),
+    NodeType.PLANET: Color(100, 150, 255),
+    NodeType.MOON: Color(200, 200, 200),
+    NodeType.ASTEROID: Color(150, 100, 50)
+}
+DEFAULT_NODE_COLOR = Color(255, 255, 255)
+if np is not None:
+    NODE_COLOR_ARRAY = np.array([_NODE_COLORS[t].rgb for t in NodeType], dtype=np.uint8)
+    # Größe je quantisierter Wichtigkeit (0..255), ersetzt 8 + importance * 20
+    NODE_SIZE_LUT = 8 + np.arange(256, dtype=np.float32) * 20 / 255
+
+# Schwellwerte 0.8 und 0.5 auf der 0..255-Skala von importance_q: floor(t * 255).
+# Da importance_q abgerundet wird, gilt importance_q > floor(t * 255) nur bei importance > t;
+# 0.5 und 0.8 (z.B. aus load_netxml) landen damit wie im Float-Pfad unterhalb der Schwelle.
+IMPORTANCE_Q_STAR = 204
+IMPORTANCE_Q_PLANET = 127
+
+# Ab dieser Knotenzahl lohnt die parallele Numba-Schleife gegenüber np.select
+NUMBA_CLASSIFY_THRESHOLD = 100_000
+
+if numba is not None and np is not None:
+    @numba.njit(parallel=True, cache=True, nogil=True)
+    def _classify_nb(importance, conns, out_type, out_size):
+        # Vergleich, Auswahl (NodeType-Werte) und Größe in einer Schleife, ohne Zwischenarrays
+        for i in numba.prange(importance.shape[0]):
+            imp = importance[i]
+            c = conns[i]
+            if imp > 0.8 or c > 10:
+                out_type[i] = 0
+            elif imp > 0.5 or c > 5:
+                out_type[i] = 1
+            elif c > 2:
+                out_type[i] = 2
+            else:
+                out_type[i] = 3
+            out_size[i] = 8 + imp * 20
+else:
+    _classify_nb = None
 
 class NodePropertiesDeterminer:
     @staticmethod
@@ -105,13 +236,7 @@ class NodePropertiesDeterminer:
 
     @staticmethod
     def determine_node_color(node_type: NodeType) -> Color:
-        color_map = {
-            NodeType.STAR: Color(255, 255, 100),
-            NodeType.PLANET: Color(100, 150, 255),
-            NodeType.MOON: Color(200, 200, 200),
-            NodeType.ASTEROID: Color(150, 100, 50)
-        }
-        return color_map.get(node_type, Color(255, 255, 255))
+        return _NODE_COLORS.get(node_type, DEFAULT_NODE_COLOR)
 
     @staticmethod
     def determine_node_size(node_data: Dict) -> float:
@@ -119,122 +244,494 @@ class NodePropertiesDeterminer:
         importance = node_data.get('importance', 0.5)
         return base_size + importance * 20
 
+    @staticmethod
+    def classify_nodes_vec(importance, conns):
+        """
+        Klassifiziert alle Knoten in einem Durchgang (SoA statt Aufruf pro Knoten).
+
+        Liefert (type_ids, colors, sizes): Typ-IDs als NodeType-Werte,
+        RGB-Werte als (N, 3) uint8 und Größen wie determine_node_size.
+        """
+        if np is None:
+            types = [NodePropertiesDeterminer.determine_node_type({'importance': i, 'connections_count': c})
+                     for i, c in zip(importance, conns)]
+            return ([int(t) for t in types],
+                    [_NODE_COLORS[t].rgb for t in types],
+                    [8 + i * 20 for i in importance])
+        importance = np.asarray(importance, dtype=np.float64)
+        conns = np.asarray(conns)
+        if _classify_nb is not None and importance.shape[0] >= NUMBA_CLASSIFY_THRESHOLD:
+            type_ids = np.empty(importance.shape[0], dtype=np.uint8)
+            sizes = np.empty(importance.shape[0], dtype=np.float64)
+            _classify_nb(importance, conns, type_ids, sizes)
+            return type_ids, NODE_COLOR_ARRAY[type_ids], sizes
+        type_ids = np.select(
+            [(importance > 0.8) | (conns > 10), (importance > 0.5) | (conns > 5), conns > 2],
+            [NodeType.STAR, NodeType.PLANET, NodeType.MOON], default=NodeType.ASTEROID).astype(np.uint8)
+        return type_ids, NODE_COLOR_ARRAY[type_ids], 8 + importance * 20
+
+    @staticmethod
+    def classify_nodes_q(importance_q, conns):
+        """
+        Wie classify_nodes_vec, aber auf importance_q (uint8) ohne Gleitkomma.
+
+        Liefert (type_ids, colors, sizes); Größen kommen aus NODE_SIZE_LUT.
+        Gleich wie classify_nodes_vec bis auf Wichtigkeiten weniger als 1/255
+        oberhalb von 0.5 bzw. 0.8, die eine Klasse tiefer landen.
+        """
+        importance_q = np.asarray(importance_q, dtype=np.uint8)
+        conns = np.asarray(conns)
+        type_ids = np.select(
+            [(importance_q > IMPORTANCE_Q_STAR) | (conns > 10), (importance_q > IMPORTANCE_Q_PLANET) | (conns > 5),
+             conns > 2],
+            [NodeType.STAR, NodeType.PLANET, NodeType.MOON], default=NodeType.ASTEROID).astype(np.uint8)
+        return type_ids, NODE_COLOR_ARRAY[type_ids], NODE_SIZE_LUT[importance_q]
+
+# ===========================
+# Ladecache
+# ===========================
+LOADER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "visualyzer")
+_CACHE_MISS = object()
+_disk_cache = None
+
+def _cache_get(key):
+    if diskcache is not None:
+        global _disk_cache
+        if _disk_cache is None:
+            _disk_cache = diskcache.Cache(LOADER_CACHE_DIR)
+        return _disk_cache.get(key, _CACHE_MISS)
+    try:
+        with open(os.path.join(LOADER_CACHE_DIR, key + ".pickle"), 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return _CACHE_MISS
+
+def _cache_set(key, value):
+    if diskcache is not None:
+        _disk_cache.set(key, value)
+        return
+    os.makedirs(LOADER_CACHE_DIR, exist_ok=True)
+    path = os.path.join(LOADER_CACHE_DIR, key + ".pickle")
+    # Erst temporär schreiben, dann atomar ersetzen
+    with open(path + ".tmp", 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+
+def _loader_cache_key(loader_name, filepath, st):
+    # Geänderte Dateien erhalten über mtime/Größe automatisch einen neuen Schlüssel
+    return hashlib.blake2b(
+        f"{loader_name}:{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}".encode()
+    ).hexdigest()
+
+def cached_loader(func=None, tag=''):
+    """
+    Cacht das geparste Ergebnis eines Dateiladers, Schlüssel: (Lader, Pfad, mtime, Größe).
+
+    tag (z.B. das verwendete Backend) geht mit in den Schlüssel ein: @cached_loader(tag=...).
+    """
+    if func is None:
+        return functools.partial(cached_loader, tag=tag)
+    loader_name = f"{func.__name__}:{tag}" if tag else func.__name__
+
+    @functools.wraps(func)
+    def wrapper(filepath):
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return func(filepath)
+        key = _loader_cache_key(loader_name, filepath, st)
+        result = _cache_get(key)
+        if result is not _CACHE_MISS:
+            return result
+        result = func(filepath)
+        # Leere Ergebnisse (auch Ladefehler) nicht cachen
+        if result:
+            try:
+                _cache_set(key, result)
+            except Exception as e:
+                logger.warning(f"Ladecache nicht beschreibbar: {e}")
+        return result
+    return wrapper
+
 # ===========================
 # Dateilader
 # ===========================
+@cached_loader
 def load_json_file(filepath):
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return _read_json(filepath)
     except Exception as e:
         logger.error(f"JSON Ladefehler: {e}")
         return {}
 
+# Einzige typisierten CSV-Spalten; alles andere bleibt String (z.B. IDs wie "007")
+CSV_NUMERIC_FIELDS = {'importance': float, 'connections_count': int}
+
+def _convert_csv_rows(rows):
+    """Wandelt nur CSV_NUMERIC_FIELDS in Zahlen, unabhängig vom verwendeten Parser."""
+    for row in rows:
+        for field, convert in CSV_NUMERIC_FIELDS.items():
+            value = row.get(field)
+            if value is None:
+                continue
+            try:
+                row[field] = convert(value)
+            except ValueError:
+                # Leere oder ungültige Zelle: Feld entfernen, damit die Defaults von node.get(...) greifen
+                del row[field]
+    return rows
+
+def _read_csv_strings(filepath):
+    """Liest alle Spalten als Strings, leere Felder als '' wie csv.DictReader."""
+    # Schlägt ein schneller Parser fehl, übernimmt der nächste statt leer zurückzugeben
+    if pl is not None:
+        try:
+            # Parst blockweise auf allen Kernen; infer_schema_length=0 liest alle Spalten
+            # als Strings, spätere Zeilen können das Schema also nicht mehr brechen
+            return pl.read_csv(filepath, infer_schema_length=0).fill_null('').to_dicts()
+        except Exception as e:
+            logger.warning(f"CSV polars-Parser fehlgeschlagen, versuche nächsten: {e}")
+    if pacsv is not None:
+        try:
+            # pyarrow kennt kein "alles als String", daher die Kopfzeile vorab lesen
+            with open(filepath, newline='') as csvfile:
+                header = next(csv.reader(csvfile), [])
+            convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in header})
+            table = pacsv.read_csv(filepath, read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                                   convert_options=convert_options)
+            return table.to_pylist()
+        except Exception as e:
+            logger.warning(f"CSV pyarrow-Parser fehlgeschlagen, versuche nächsten: {e}")
+    with open(filepath, newline='', buffering=LOADER_BUFFER_SIZE) as csvfile:
+        reader = csv.DictReader(csvfile)
+        return [row for row in reader]
+
+@cached_loader(tag=CSV_BACKEND)
 def load_csv_file(filepath):
     try:
-        with open(filepath, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            return [row for row in reader]
+        return _convert_csv_rows(_read_csv_strings(filepath))
     except Exception as e:
         logger.error(f"CSV Ladefehler: {e}")
         return []
 
-def load_sqlite_db(filepath, query):
+# Zeilen pro fetchmany-Aufruf beim Streamen von Datenbankergebnissen
+DB_FETCH_BATCH = 1024
+
+def _iter_cursor_dicts(cursor, batch):
+    """Liefert die Zeilen eines ausgeführten Cursors stapelweise als Dicts."""
+    rows = cursor.fetchmany(batch)
+    # description ist bei serverseitigen Cursorn erst nach dem ersten Fetch gesetzt
+    columns = [col[0] for col in cursor.description] if cursor.description else []
+    while rows:
+        for row in rows:
+            yield dict(zip(columns, row))
+        rows = cursor.fetchmany(batch)
+
+# Nur lesende Pragmas: die Datei des Nutzers (z.B. ihr Journal-Modus) bleibt unverändert
+SQLITE_READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def load_sqlite_db(filepath, query, batch=DB_FETCH_BATCH):
+    """Generator: streamt das Abfrageergebnis zeilenweise statt per fetchall()."""
     try:
         conn = sqlite3.connect(filepath)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        columns = [col[0] for col in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
     except Exception as e:
         logger.error(f"SQLite Ladefehler: {e}")
-        return []
+        return
+    try:
+        for pragma in SQLITE_READ_PRAGMAS:
+            conn.execute(pragma)
+        # Dicts wie bei load_postgres_db, damit node.get(...) überall funktioniert
+        yield from _iter_cursor_dicts(conn.execute(query), batch)
+    except Exception as e:
+        logger.error(f"SQLite Ladefehler: {e}")
+    finally:
+        conn.close()
 
-def load_postgres_db(dsn, query):
+def load_postgres_db(dsn, query, batch=DB_FETCH_BATCH):
+    """Generator: streamt das Abfrageergebnis über einen serverseitigen Cursor."""
     try:
         conn = psycopg2.connect(dsn)
-        cursor = conn.cursor()
+    except Exception as e:
+        logger.error(f"PostgreSQL Ladefehler: {e}")
+        return
+    try:
+        # Benannter Cursor: der Server hält das Ergebnis, der Client holt nur Stapel
+        cursor = conn.cursor(name='visualyzer_stream')
+        cursor.itersize = batch
         cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        yield from _iter_cursor_dicts(cursor, batch)
     except Exception as e:
         logger.error(f"PostgreSQL Ladefehler: {e}")
-        return []
+    finally:
+        conn.close()
 
+@cached_loader
 def load_netxml(filepath):
     try:
-        tree = ET.parse(filepath)
-        root = tree.getroot()
-        return [{'id': node.get('id'), 'importance': random.random(), 'connections_count': random.randint(1, 10)} for node in root.findall(".//wireless-network")]
+        nodes = []
+        # Streamend parsen und jedes fertige Netz sofort freigeben statt den ganzen Baum zu halten
+        for _, elem in ET.iterparse(filepath, events=('end',)):
+            if elem.tag != 'wireless-network':
+                continue
+            # Wichtigkeit aus SSIDs und Clients im selben Durchgang statt Zufallswerten
+            ssids = len(elem.findall('SSID'))
+            clients = len(elem.findall('wireless-client'))
+            nodes.append({'id': elem.get('id'), 'importance': min(1.0, (ssids + clients) / 10), 'connections_count': clients})
+            elem.clear()
+        return nodes
     except Exception as e:
         logger.error(f"NetXML Ladefehler: {e}")
         return []
 
+# Magic-Zahl klassischer pcap-Dateien (µs und ns) -> Byte-Reihenfolge
+_PCAP_BYTE_ORDER = {
+    b'\xd4\xc3\xb2\xa1': '<',
+    b'\xa1\xb2\xc3\xd4': '>',
+    b'\x4d\x3c\xb2\xa1': '<',
+    b'\xa1\xb2\x3c\x4d': '>'
+}
+# Record-Header: ts_sec, ts_usec, incl_len, orig_len
+_PCAP_RECORD_HEADER = {order: struct.Struct(order + 'IIII') for order in '<>'}
+_PCAP_GLOBAL_HEADER_SIZE = 24
+
+def _count_pcap_records(filepath, limit):
+    """
+    Zählt bis zu limit vollständige Pakete einer klassischen pcap-Datei.
+
+    Liest nur die Record-Header per mmap, ohne Pakete zu dekodieren.
+    Gibt None zurück, wenn die Datei kein klassisches pcap ist (z.B. pcapng).
+    """
+    with open(filepath, 'rb') as f:
+        order = _PCAP_BYTE_ORDER.get(f.read(4))
+        if order is None:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            record = _PCAP_RECORD_HEADER[order]
+            size = len(buf)
+            offset = _PCAP_GLOBAL_HEADER_SIZE
+            count = 0
+            while count < limit and offset + record.size <= size:
+                offset += record.size + record.unpack_from(buf, offset)[2]
+                if offset > size:
+                    break
+                count += 1
+            return count
+
+@cached_loader
 def load_pcap(filepath):
     try:
-        packets = rdpcap(filepath)
-        return [{'id': str(i), 'importance': random.random(), 'connections_count': random.randint(1, 5)} for i, pkt in enumerate(packets[:10])]
+        # Nur die ersten 10 Pakete zählen, ohne scapy-Dissektoren
+        count = _count_pcap_records(filepath, 10)
+        if count is None:
+            with PcapReader(filepath) as reader:
+                count = sum(1 for _ in itertools.islice(reader, 10))
+        return [{'id': str(i), 'importance': random.random(), 'connections_count': random.randint(1, 5)} for i in range(count)]
     except Exception as e:
         logger.error(f"PCAP Ladefehler: {e}")
         return []
 
+if np is not None:
+    # Knoten als Structure-of-Arrays: je Feld ein zusammenhängender Puffer
+    # importance als f8 wie in den Dicts, damit classify_nodes_vec bei 0.5/0.8 gleich entscheidet
+    # importance_q: Wichtigkeit auf 0..255 quantisiert, 1 statt 8 Byte pro Knoten
+    NODE_DTYPE = np.dtype([('id', 'U32'), ('importance', 'f8'), ('importance_q', 'u1'),
+                           ('connections_count', 'i4')])
+
+def to_node_array(nodes):
+    """
+    Wandelt Knoten-Dicts (Liste oder Iterator, z.B. aus den Ladern) in ein strukturiertes NumPy-Array.
+
+    nodes['importance'] und nodes['connections_count'] gehen direkt an
+    NodePropertiesDeterminer.classify_nodes_vec.
+    """
+    if np is None:
+        raise ImportError("to_node_array benötigt numpy")
+    # Generatoren (z.B. load_sqlite_db/load_postgres_db) einmal materialisieren
+    if not isinstance(nodes, (list, tuple)):
+        nodes = list(nodes)
+    array = np.empty(len(nodes), dtype=NODE_DTYPE)
+    # Spaltenweise füllen statt ein Tupel pro Knoten zu bauen
+    array['id'] = [node.get('id') or '' for node in nodes]
+    array['importance'] = [node.get('importance', 0) for node in nodes]
+    # Abrunden, nicht runden: sonst wird 0.5 zu 128 und damit fälschlich PLANET
+    array['importance_q'] = np.floor(np.clip(array['importance'], 0, 1) * 255)
+    array['connections_count'] = [node.get('connections_count', 0) for node in nodes]
+    return array
+
+def load_node_array(filepath, loader):
+    """
+    Lädt Knoten über loader (z.B. load_netxml) als strukturiertes Array, gecacht als .npy.
+
+    Cache-Treffer werden per mmap geöffnet: kein Parsen und keine Python-Objekte
+    pro Knoten, das Betriebssystem lädt nur die gelesenen Seiten.
+    """
+    if np is None:
+        raise ImportError("load_node_array benötigt numpy")
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return to_node_array(loader(filepath))
+    path = os.path.join(LOADER_CACHE_DIR, _loader_cache_key(loader.__name__, filepath, st) + ".npy")
+    try:
+        cached = np.load(path, mmap_mode='r')
+        # Caches mit älterem Layout (z.B. importance als f4) neu erzeugen
+        if cached.dtype == NODE_DTYPE:
+            return cached
+    except (OSError, ValueError):
+        pass
+    nodes = to_node_array(loader(filepath))
+    # Leere Ergebnisse (auch Ladefehler) nicht cachen
+    if len(nodes):
+        try:
+            os.makedirs(LOADER_CACHE_DIR, exist_ok=True)
+            with open(path + ".tmp", 'wb') as f:
+                np.save(f, nodes)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.warning(f"Ladecache nicht beschreibbar: {e}")
+    return nodes
+
 # ===========================
 # Verzeichnisscan
 # ===========================
+# Verzeichnisse ohne verwertbare Datenquellen, werden beim Scan übersprungen
+SCAN_SKIP_DIRS = frozenset({'.cache', '.git'})
+
+# Dateiendung -> Kategorie, ein Dict-Zugriff statt endswith-Kette pro Datei
+EXT_MAP = {
+    ".json": "json",
+    ".csv": "csv",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".netxml": "netxml",
+    ".pcap": "pcap",
+    ".cap": "pcap",
+    ".pgpass": "postgres"
+}
+
+# Sonstige PostgreSQL-Dateien, ohne den Dateinamen vorher kleinzuschreiben
+_POSTGRES_NAME_RE = re.compile('postgres', re.IGNORECASE)
+
+# Ab so vielen Unterverzeichnissen in ~ wird parallel gescannt
+SCAN_PARALLEL_MIN_DIRS = 4
+
+def _new_found_files():
+    return {"json": [], "csv": [], "sqlite": [], "netxml": [], "pcap": [], "postgres": []}
+
+def _scan_dir(path, found_files, subdirs):
+    """Klassifiziert die Dateien eines Verzeichnisses und sammelt dessen Unterverzeichnisse."""
+    # os.scandir: DirEntry liefert den Typ aus getdents, ohne stat pro Datei
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Wie os.walk: Symlinks auf Verzeichnisse nicht verfolgen
+                if entry.name not in SCAN_SKIP_DIRS and not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            f = entry.name
+            # Nur die kurze Endung kleinschreiben, nicht den ganzen Namen
+            key = EXT_MAP.get(f[f.rfind('.'):].lower())
+            if key is None and _POSTGRES_NAME_RE.search(f):
+                key = "postgres"
+            if key is not None:
+                found_files[key].append(entry.path)
+
+def _scan_subtree(path):
+    found_files = _new_found_files()
+    stack = [path]
+    while stack:
+        _scan_dir(stack.pop(), found_files, stack)
+    return found_files
+
 def scan_home_for_data():
     home = os.path.expanduser("~")
-    found_files = {"json": [], "csv": [], "sqlite": [], "netxml": [], "pcap": [], "postgres": []}
-    for root, _, files in os.walk(home):
-        for f in files:
-            if f.endswith(".json"):
-                found_files["json"].append(os.path.join(root, f))
-            elif f.endswith(".csv"):
-                found_files["csv"].append(os.path.join(root, f))
-            elif f.endswith(".db") or f.endswith(".sqlite"):
-                found_files["sqlite"].append(os.path.join(root, f))
-            elif f.endswith(".netxml"):
-                found_files["netxml"].append(os.path.join(root, f))
-            elif f.endswith(".pcap") or f.endswith(".cap"):
-                found_files["pcap"].append(os.path.join(root, f))
-            elif f.endswith(".pgpass") or "postgres" in f.lower():
-                found_files["postgres"].append(os.path.join(root, f))
+    found_files = _new_found_files()
+    subdirs = []
+    _scan_dir(home, found_files, subdirs)
+
+    if len(subdirs) < SCAN_PARALLEL_MIN_DIRS:
+        for path in subdirs:
+            for key, paths in _scan_subtree(path).items():
+                found_files[key].extend(paths)
+    else:
+        # Threads genügen: scandir/stat geben die GIL während der Syscalls frei
+        workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(_scan_subtree, subdirs):
+                for key, paths in result.items():
+                    found_files[key].extend(paths)
+
     logger.info(f"Gefundene Dateien im Home-Verzeichnis: {found_files}")
     return found_files
 
 # ===========================
 # CLI Argumente
 # ===========================
-parser = argparse.ArgumentParser(description='Visualyzer - Netzwerkvisualisierung als Planetensystem')
-parser.add_argument('--json', help='Netzwerkdaten aus JSON-Datei laden')
-parser.add_argument('--csv', help='Netzwerkdaten aus CSV-Datei laden')
-parser.add_argument('--sqlite', help='SQLite Datei')
-parser.add_argument('--sqlquery', help='SQL Query')
-parser.add_argument('--postgres', help='PostgreSQL DSN')
-parser.add_argument('--pcap', help='PCAP Datei laden')
-parser.add_argument('--netxml', help='NetXML Datei laden')
-parser.add_argument('--scanhome', action='store_true', help='Home-Verzeichnis nach Datenquellen durchsuchen')
-args = parser.parse_args()
+def _parse_cli(argv=None):
+    # Nur beim Start als Skript, nicht beim Import als Bibliothek
+    parser = argparse.ArgumentParser(description='Visualyzer - Netzwerkvisualisierung als Planetensystem')
+    parser.add_argument('--json', help='Netzwerkdaten aus JSON-Datei laden')
+    parser.add_argument('--csv', help='Netzwerkdaten aus CSV-Datei laden')
+    parser.add_argument('--sqlite', help='SQLite Datei')
+    parser.add_argument('--sqlquery', help='SQL Query')
+    parser.add_argument('--postgres', help='PostgreSQL DSN')
+    parser.add_argument('--pcap', help='PCAP Datei laden')
+    parser.add_argument('--netxml', help='NetXML Datei laden')
+    parser.add_argument('--scanhome', action='store_true', help='Home-Verzeichnis nach Datenquellen durchsuchen')
+    return parser.parse_args(argv)
 
 # ===========================
 # Tkinter Menüfenster
 # ===========================
-def open_tkinter_menu():
-    def choose_file():
-        filepath = filedialog.askopenfilename()
-        messagebox.showinfo("Ausgewählt", f"Datei: {filepath}")
+def open_tkinter_menu(block=True):
+    """
+    Öffnet das Menüfenster; gewählte Dateipfade landen in der zurückgegebenen Queue.
+
+    Mit block=False läuft Tk in einem eigenen Daemon-Thread, sodass Scan und
+    Visualisierung parallel weiterlaufen.
+    """
+    chosen_files = queue.Queue()
+
+    def run_menu():
+        # Tk muss vollständig in dem Thread leben, der die mainloop ausführt
+        def choose_file():
+            filepath = filedialog.askopenfilename()
+            if filepath:
+                chosen_files.put(filepath)
+            messagebox.showinfo("Ausgewählt", f"Datei: {filepath}")
+
+        root = tk.Tk()
+        root.title("Visualyzer Menü")
+        tk.Button(root, text="Datei öffnen", command=choose_file).pack()
+        tk.Button(root, text="Beenden", command=root.destroy).pack()
+        root.mainloop()
 
-    root = tk.Tk()
-    root.title("Visualyzer Menü")
-    tk.Button(root, text="Datei öffnen", command=choose_file).pack()
-    tk.Button(root, text="Beenden", command=root.destroy).pack()
-    root.mainloop()
+    if block:
+        run_menu()
+    else:
+        threading.Thread(target=run_menu, name="visualyzer-menu", daemon=True).start()
+    return chosen_files
 
 # ===========================
 # Statusanzeige CLI
 # ===========================
-CLIStatus.print_status("Visualyzer gestartet")
+if __name__ == "__main__":
+    args = _parse_cli()
+    CLIStatus.print_status("Visualyzer gestartet")
 
-if args.scanhome:
-    scan_home_for_data()
+    if args.scanhome:
+        scan_home_for_data()
 
 # Der Visualisierungs- und GUI-Teil folgt modularisiert in visualyzer_gui.py, visualyzer_core.py etc.